@@ -0,0 +1,154 @@
+from bisect import bisect_left, insort
+
+
+class SetBaseline:
+    """
+    Baseline backed by a Python set.
+    Prefix queries fall back to a linear scan over all stored words.
+    """
+    def __init__(self):
+        self.words = set()
+
+    def insert(self, word):
+        """Insert a word into the set"""
+        if word:
+            self.words.add(word)
+
+    def search(self, word, exact=False):
+        """Search for a word, or for any word starting with it"""
+        if exact:
+            return word in self.words
+        return any(w.startswith(word) for w in self.words)
+
+    def keys_with_prefix(self, prefix):
+        """Return all words that start with prefix, in sorted order"""
+        return sorted(w for w in self.words if w.startswith(prefix))
+
+    def __len__(self):
+        return len(self.words)
+
+
+class DictBaseline:
+    """
+    Baseline backed by a Python dict mapping each word to True.
+    Prefix queries fall back to a linear scan over all stored words.
+    """
+    def __init__(self):
+        self.words = {}
+
+    def insert(self, word):
+        """Insert a word into the dict"""
+        if word:
+            self.words[word] = True
+
+    def search(self, word, exact=False):
+        """Search for a word, or for any word starting with it"""
+        if exact:
+            return word in self.words
+        return any(w.startswith(word) for w in self.words)
+
+    def keys_with_prefix(self, prefix):
+        """Return all words that start with prefix, in sorted order"""
+        return sorted(w for w in self.words if w.startswith(prefix))
+
+    def __len__(self):
+        return len(self.words)
+
+
+class SortedListBaseline:
+    """
+    Baseline backed by a sorted list.
+    Searches and prefix ranges use bisect, inserts use insort.
+    """
+    def __init__(self):
+        self.words = []
+
+    def insert(self, word):
+        """Insert a word, keeping the list sorted and free of duplicates"""
+        if not word:
+            return
+        i = bisect_left(self.words, word)
+        if i == len(self.words) or self.words[i] != word:
+            insort(self.words, word, lo=i, hi=i)
+
+    def search(self, word, exact=False):
+        """Search for a word, or for any word starting with it"""
+        i = bisect_left(self.words, word)
+        if i == len(self.words):
+            return False
+        if exact:
+            return self.words[i] == word
+        return self.words[i].startswith(word)
+
+    def keys_with_prefix(self, prefix):
+        """Return all words that start with prefix, in sorted order"""
+        start = bisect_left(self.words, prefix)
+        end = start
+        while end < len(self.words) and self.words[end].startswith(prefix):
+            end += 1
+        return self.words[start:end]
+
+    def __len__(self):
+        return len(self.words)
+
+
+_END = ''  # Key marking end of word, can never clash with a single character
+
+
+class DictTrieBaseline:
+    """
+    Baseline trie built from nested dicts, one dict per node.
+    """
+    def __init__(self):
+        self.root = {}
+        self.size = 0
+
+    def insert(self, word):
+        """Insert a word into the trie"""
+        if not word:
+            return
+        node = self.root
+        for char in word:
+            node = node.setdefault(char, {})
+        if _END not in node:
+            node[_END] = True
+            self.size += 1
+
+    def _find_node(self, prefix):
+        """Helper method returning the node reached by prefix, or None"""
+        node = self.root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return None
+        return node
+
+    def search(self, word, exact=False):
+        """Search for a word, or for any word starting with it"""
+        if exact and not word:
+            return False
+        node = self._find_node(word)
+        if node is None:
+            return False
+        return _END in node if exact else bool(node)
+
+    def keys_with_prefix(self, prefix):
+        """Return all words that start with prefix, in sorted order"""
+        node = self._find_node(prefix)
+        result = []
+        if node is not None:
+            self._collect(node, list(prefix), result)
+        return result
+
+    def _collect(self, node, buffer, result):
+        """Helper method collecting all words below node"""
+        if _END in node:
+            result.append(''.join(buffer))
+        for char in sorted(node):
+            if char != _END:
+                buffer.append(char)
+                self._collect(node[char], buffer, result)
+                buffer.pop()
+
+    def __len__(self):
+        return self.size
@@ -0,0 +1,291 @@
+import argparse
+import csv
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+from itertools import islice
+from typing import List
+
+from ternary_search_tree import TernarySearchTree
+from corpus_generator import CorpusGenerator
+
+# Setup logging to both console and file
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s: %(message)s',
+    handlers=[
+        logging.FileHandler('tst_test_results.log'),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+# Metrics where a higher value is better; the regression gate compares medians of these
+RATE_METRICS = ('insert_rate', 'search_rate', 'miss_rate')
+
+CSV_FIELDS = ('size', 'repetition', 'seed', 'source', 'core',
+              'insert_time', 'search_time', 'miss_time') + RATE_METRICS
+
+# Sources of the inserted words, a sweep uses one source for every size
+WORD_FILE = 'word_file'
+SYNTHETIC = 'synthetic'
+
+# Per-worker state, set up by _init_worker
+_worker_core = None
+_worker_word_list = None
+_worker_word_set = None
+
+
+def _init_worker(core_queue, word_file):
+    """Pin this worker process to one free core and load the word list once"""
+    global _worker_core, _worker_word_list, _worker_word_set
+    core = core_queue.get()
+    if hasattr(os, 'sched_setaffinity'):
+        os.sched_setaffinity(0, {core})
+        _worker_core = core
+    _worker_word_list = read_word_list(word_file) if word_file else []
+    _worker_word_set = set(_worker_word_list)
+
+
+def read_word_list(word_file: str) -> List[str]:
+    """Return the stripped, non-blank lines of word_file"""
+    with open(word_file, 'r') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def _task_words(size: int, seed: int, synthetic: bool):
+    """
+    Pick size words to insert and size words to miss for one task
+
+    From the word file the inserted words are sampled from the list and the
+    misses are synthetic words that are not in it, so every size uses the same
+    key distribution for both.
+    """
+    if synthetic:
+        corpus = list(CorpusGenerator(seed=seed).words(2 * size))
+        return corpus[:size], corpus[size:], SYNTHETIC
+    words = random.Random(seed).sample(_worker_word_list, k=size)
+    generator = CorpusGenerator(seed=seed)
+    misses = (word for word in iter(generator.word, None) if word not in _worker_word_set)
+    return words, list(islice(misses, size)), WORD_FILE
+
+
+def run_sweep_task(size: int, repetition: int, seed: int, synthetic: bool) -> dict:
+    """Build a TST of size words and time insert, exact search of hits and of misses"""
+    words, miss_words, source = _task_words(size, seed, synthetic)
+
+    tst = TernarySearchTree()
+    start_time = time.perf_counter()
+    for word in words:
+        tst.insert(word)
+    insert_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    for word in words:
+        tst.search(word, exact=True)
+    search_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    for word in miss_words:
+        tst.search(word, exact=True)
+    miss_time = time.perf_counter() - start_time
+
+    return {
+        'size': size,
+        'repetition': repetition,
+        'seed': seed,
+        'source': source,
+        'core': _worker_core,
+        'insert_time': insert_time,
+        'search_time': search_time,
+        'miss_time': miss_time,
+        'insert_rate': size / insert_time,
+        'search_rate': size / search_time,
+        'miss_rate': len(miss_words) / miss_time,
+    }
+
+
+def collect_environment(args, workers: int) -> dict:
+    """Return metadata describing the machine and settings a sweep ran with"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'hostname': socket.gethostname(),
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'python_version': platform.python_version(),
+        'python_implementation': platform.python_implementation(),
+        'cpu_count': os.cpu_count(),
+        'git_commit': commit,
+        'sizes': args.sizes,
+        'repetitions': args.repetitions,
+        'workers': workers,
+        'seed': args.seed,
+        'synthetic': args.synthetic,
+        'word_file': args.word_file,
+    }
+
+
+def summarize(runs: List[dict]) -> dict:
+    """Return the median of every rate metric per source and size, as summary[source][size]"""
+    summary = {}
+    for source, size in sorted({(run['source'], run['size']) for run in runs}):
+        size_runs = [run for run in runs if run['source'] == source and run['size'] == size]
+        summary.setdefault(source, {})[str(size)] = {metric: statistics.median(run[metric] for run in size_runs)
+                                                     for metric in RATE_METRICS}
+    return summary
+
+
+def find_regressions(summary: dict, baseline_summary: dict, tolerance: float) -> List[str]:
+    """
+    Compare summaries and describe every metric that dropped more than tolerance
+    (a fraction, e.g. 0.1 for 10%) below the baseline. Only the same size from
+    the same source is compared, (source, size) pairs missing from either
+    summary are skipped.
+    """
+    regressions = []
+    for source, sizes in summary.items():
+        baseline_sizes = baseline_summary.get(source, {})
+        for size, metrics in sizes.items():
+            if size not in baseline_sizes:
+                continue
+            for metric in RATE_METRICS:
+                baseline_value = baseline_sizes[size].get(metric)
+                if baseline_value is None:
+                    continue
+                if metrics[metric] < baseline_value * (1 - tolerance):
+                    change = (metrics[metric] - baseline_value) / baseline_value
+                    regressions.append(f"{source} size {size} {metric}: {metrics[metric]:.2f} vs baseline "
+                                       f"{baseline_value:.2f} ({change:+.1%})")
+    return regressions
+
+
+def sweep_workers(workers: int) -> int:
+    """Return the number of workers a sweep actually uses, at most one per available core"""
+    return max(1, min(workers, len(_available_cores())))
+
+
+def _available_cores() -> List[int]:
+    """Return the cores this process may run on"""
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def run_sweep(sizes: List[int], repetitions: int, workers: int, seed: int,
+              synthetic: bool = False, word_file: str = None) -> List[dict]:
+    """
+    Run every (size, repetition) pair in a process pool, one pinned core per worker
+
+    Without synthetic every size samples the word file, which raises
+    ValueError if it holds fewer words than the largest size.
+    """
+    if not synthetic:
+        nr_words = len(read_word_list(word_file)) if word_file and os.path.exists(word_file) else 0
+        if nr_words < max(sizes):
+            raise ValueError(f"Word file {word_file} has {nr_words} words, fewer than size {max(sizes)}; "
+                             f"use --synthetic for larger sizes")
+    available_cores = _available_cores()
+    workers = sweep_workers(workers)
+    logger.info(f"Running {len(sizes) * repetitions} tasks on {workers} workers")
+
+    runs = []
+    with multiprocessing.Manager() as manager:
+        core_queue = manager.Queue()
+        for core in available_cores[:workers]:
+            core_queue.put(core)
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(core_queue, word_file)) as executor:
+            futures = [executor.submit(run_sweep_task, size, repetition, seed + 1000 * repetition + size, synthetic)
+                       for size in sizes for repetition in range(repetitions)]
+            for future in as_completed(futures):
+                run = future.result()
+                logger.info(f"Size {run['size']} repetition {run['repetition']} on core {run['core']}: "
+                            f"insert={run['insert_rate']:.2f} words/sec, search={run['search_rate']:.2f} words/sec")
+                runs.append(run)
+
+    runs.sort(key=lambda run: (run['size'], run['repetition']))
+    return runs
+
+
+def write_results(runs: List[dict], environment: dict, output_dir: str) -> str:
+    """Write sweep_results.json (environment, runs, summary) and sweep_results.csv (runs)"""
+    json_path = os.path.join(output_dir, 'sweep_results.json')
+    with open(json_path, 'w') as f:
+        json.dump({'environment': environment, 'runs': runs, 'summary': summarize(runs)}, f, indent=2)
+
+    csv_path = os.path.join(output_dir, 'sweep_results.csv')
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(runs)
+
+    logger.info(f"Results saved to: {json_path} and {csv_path}")
+    return json_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run a local parallel TST benchmark sweep')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 500, 1000, 5000, 10000, 50000],
+                        help='Sizes to test')
+    parser.add_argument('--repetitions', type=int, default=5, help='Number of runs per size')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Number of worker processes')
+    parser.add_argument('--seed', type=int, default=42, help='Base seed for sampling words')
+    parser.add_argument('--synthetic', action='store_true', help='Use the synthetic corpus for every size')
+    parser.add_argument('--word-file', type=str, default='data/search_trees/corncob_lowercase.txt',
+                        help='Path to word list file, it must hold at least the largest size')
+    parser.add_argument('--output-dir', type=str, default='benchmark_results', help='Output directory for results')
+    parser.add_argument('--baseline', type=str, help='sweep_results.json to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help='Allowed relative drop of a median rate before it counts as a regression')
+
+    args = parser.parse_args()
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    try:
+        runs = run_sweep(args.sizes, args.repetitions, args.workers, args.seed, args.synthetic, args.word_file)
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(2)
+    write_results(runs, collect_environment(args, sweep_workers(args.workers)), args.output_dir)
+
+    if args.baseline:
+        try:
+            with open(args.baseline, 'r') as f:
+                baseline_summary = json.load(f)['summary']
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"Could not read baseline {args.baseline}: {e}")
+            sys.exit(2)
+
+        summary = summarize(runs)
+        compared = [(source, size) for source, sizes in summary.items() for size in sizes
+                    if size in baseline_summary.get(source, {})]
+        if not compared:
+            logger.warning(f"Baseline {args.baseline} has no size from the same source as this sweep, "
+                           f"nothing was compared")
+        regressions = find_regressions(summary, baseline_summary, args.tolerance)
+        if regressions:
+            logger.error(f"{len(regressions)} metric(s) regressed beyond {args.tolerance:.0%}:")
+            for regression in regressions:
+                logger.error(f"  {regression}")
+            sys.exit(1)
+        logger.info(f"No regressions beyond {args.tolerance:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import math
+
+
+class BloomFilter:
+    """
+    Bloom filter for approximate membership of strings.
+
+    A word that was added is always reported as present. A word that was not
+    added is reported as present with probability of about false_positive_rate,
+    as long as no more than capacity words have been added.
+
+    Bit positions are derived from Python's built-in str hash, which is cached
+    on the string and randomized per process, so a filter must not be stored
+    and reloaded by another process; rebuild it from the words instead.
+    """
+    def __init__(self, capacity, false_positive_rate=0.01):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0.0 < false_positive_rate < 1.0:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        # Optimal number of bits and hash functions for capacity and false_positive_rate
+        self.nr_bits = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.nr_hashes = max(1, round(self.nr_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.nr_bits + 7) // 8)
+        self.count = 0
+
+    def add(self, word):
+        """Add a word to the filter"""
+        h = hash(word)
+        h1 = h & 0xFFFFFFFF
+        h2 = ((h >> 32) & 0xFFFFFFFF) | 1  # Double hashing, h2 odd so it never degenerates
+        bits = self.bits
+        nr_bits = self.nr_bits
+        for i in range(self.nr_hashes):
+            position = (h1 + i * h2) % nr_bits
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, word):
+        """Return False if word was certainly not added, True if it probably was"""
+        h = hash(word)
+        h1 = h & 0xFFFFFFFF
+        h2 = ((h >> 32) & 0xFFFFFFFF) | 1
+        bits = self.bits
+        nr_bits = self.nr_bits
+        for i in range(self.nr_hashes):
+            position = (h1 + i * h2) % nr_bits
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def __len__(self):
+        """Return the number of words added"""
+        return self.count
+
+    @property
+    def memory_bytes(self):
+        """Return the size of the bit array in bytes"""
+        return len(self.bits)
@@ -1,7 +1,9 @@
 import os
 import glob
+import json
 import matplotlib.pyplot as plt
 import re
+import statistics
 import logging
 import sys
 
@@ -58,12 +60,12 @@ def collect_single_benchmark_results(results_dir):
     
     return sorted(zip(sizes, insert_times, search_times))
 
-def collect_multiple_benchmark_results(results_dir):
-    """Collect results from benchmark_results.txt (multiple sizes file)"""
-    results_file = os.path.join(results_dir, "benchmark_results.txt")
+def collect_multiple_benchmark_results(results_dir, filename="benchmark_results.txt"):
+    """Collect results from benchmark_results.txt (multiple sizes file) or a file in the same format"""
+    results_file = os.path.join(results_dir, filename)
     
     if not os.path.exists(results_file):
-        logger.info("No benchmark_results.txt found")
+        logger.info(f"No {filename} found")
         return []
     
     logger.info(f"Processing {results_file}")
@@ -102,72 +104,205 @@ def collect_multiple_benchmark_results(results_dir):
         logger.error(f"Error processing {results_file}: {e}")
         return []
 
+def collect_sweep_results(results_dir):
+    """Collect median times per size from sweep_results.json (benchmark_sweep.py)"""
+    results_file = os.path.join(results_dir, "sweep_results.json")
+    
+    if not os.path.exists(results_file):
+        logger.info("No sweep_results.json found")
+        return []
+    
+    logger.info(f"Processing {results_file}")
+    
+    try:
+        with open(results_file, 'r') as f:
+            runs = json.load(f)['runs']
+        
+        results = []
+        for size in sorted({run['size'] for run in runs}):
+            size_runs = [run for run in runs if run['size'] == size]
+            insert_time = statistics.median(run['insert_time'] for run in size_runs)
+            search_time = statistics.median(run['search_time'] for run in size_runs)
+            results.append((size, insert_time, search_time))
+            logger.info(f"Parsed sweep: size={size}, insert={insert_time}s, search={search_time}s")
+        return results
+        
+    except Exception as e:
+        logger.error(f"Error processing {results_file}: {e}")
+        return []
+
 def collect_results(results_dir):
-    """Collect results from all available benchmark files"""
+    """
+    Collect results from all available benchmark files, as a dict mapping
+    each source to its list of (size, insert_time, search_time)
+
+    The sources time different workloads (benchmark_results.txt inserts and
+    searches 50 test words, the sweep and the per-size files all size words), so
+    they are kept apart and plotted as separate series instead of being merged.
+    """
     if not os.path.exists(results_dir):
         logger.error(f"Results directory does not exist: {results_dir}")
-        return []
+        return {}
     
     logger.info(f"Collecting results from: {results_dir}")
     
-    # Try multiple benchmark results first
-    results = collect_multiple_benchmark_results(results_dir)
+    sources = {
+        'sweep_results.json': collect_sweep_results(results_dir),
+        'benchmark_results.txt': collect_multiple_benchmark_results(results_dir),
+        'benchmark_size_*.txt': collect_single_benchmark_results(results_dir),
+    }
+    results = {label: points for label, points in sources.items() if points}
     
-    # If no multiple results, try individual files
     if not results:
-        results = collect_single_benchmark_results(results_dir)
-    
-    # If still no results, try both and combine
-    if not results:
-        logger.warning("No results found in either format")
+        logger.warning("No results found in any format")
         # List all files in directory for debugging
         all_files = os.listdir(results_dir)
         logger.info(f"Files in directory: {all_files}")
     
-    logger.info(f"Total results collected: {len(results)}")
+    logger.info(f"Total results collected: {sum(len(points) for points in results.values())} "
+                f"from {len(results)} sources")
     return results
 
-def plot_results(results, output_dir):
-    """Create plots from collected results"""
+def collect_comparison_results(results_dir):
+    """Collect results from comparison_results.txt (--compare option)"""
+    results_file = os.path.join(results_dir, "comparison_results.txt")
+    
+    if not os.path.exists(results_file):
+        logger.info("No comparison_results.txt found")
+        return {}
+    
+    logger.info(f"Processing {results_file}")
+    
+    # Maps structure name to a list of (size, metrics) tuples
+    results = {}
+    
+    try:
+        with open(results_file, 'r') as f:
+            content = f.read()
+        
+        for section in re.split(r'-{20,}', content):
+            size_match = re.search(r"Tree Size: (\d+)", section)
+            name_match = re.search(r"Structure: (\S+)", section)
+            metric_matches = {
+                'insert_rate': re.search(r"Insert rate: ([\d.]+)", section),
+                'search_rate': re.search(r"Search rate: ([\d.]+)", section),
+                'miss_rate': re.search(r"Miss rate: ([\d.]+)", section),
+                'prefix_rate': re.search(r"Prefix rate: ([\d.]+)", section),
+                'memory': re.search(r"Memory: (\d+) bytes", section),
+            }
+            
+            if size_match and name_match and all(metric_matches.values()):
+                size = int(size_match.group(1))
+                metrics = {key: float(match.group(1)) for key, match in metric_matches.items()}
+                results.setdefault(name_match.group(1), []).append((size, metrics))
+        
+        for name in results:
+            results[name].sort(key=lambda item: item[0])
+        logger.info(f"Parsed comparison results for structures: {list(results)}")
+        return results
+        
+    except Exception as e:
+        logger.error(f"Error processing {results_file}: {e}")
+        return {}
+
+def plot_comparison(results, output_dir):
+    """Create side-by-side throughput and memory chart for all compared structures"""
     if not results:
-        logger.error("No results to plot")
+        logger.error("No comparison results to plot")
         return
     
-    sizes, insert_times, search_times = zip(*results)
+    panels = [
+        ('insert_rate', 'Insert Throughput', 'Words / second'),
+        ('search_rate', 'Exact Search Throughput (hits)', 'Words / second'),
+        ('miss_rate', 'Exact Search Throughput (misses)', 'Words / second'),
+        ('prefix_rate', 'Prefix Enumeration Throughput', 'Queries / second'),
+        ('memory', 'Memory Usage', 'Bytes'),
+    ]
+    
+    plt.figure(figsize=(18, 10))
+    for i, (key, title, ylabel) in enumerate(panels, start=1):
+        plt.subplot(2, 3, i)
+        for name, points in results.items():
+            sizes = [size for size, _ in points]
+            values = [metrics[key] for _, metrics in points]
+            plt.plot(sizes, values, '-o', label=name, markersize=6, linewidth=2)
+        plt.title(title, fontsize=14)
+        plt.xlabel('Number of Words', fontsize=12)
+        plt.ylabel(ylabel, fontsize=12)
+        plt.xscale('log')
+        plt.yscale('log')
+        plt.grid(True, alpha=0.3)
+        plt.legend(fontsize=10)
     
-    logger.info(f"Plotting {len(results)} data points")
-    logger.info(f"Size range: {min(sizes)} to {max(sizes)}")
+    plt.tight_layout()
+    
+    output_path = os.path.join(output_dir, 'structure_comparison.png')
+    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    logger.info(f"Comparison plot saved to: {output_path}")
+    
+    # Print summary table
+    print("\n" + "="*80)
+    print("STRUCTURE COMPARISON SUMMARY")
+    print("="*80)
+    for name, points in results.items():
+        for size, metrics in points:
+            print(f"{name:12s} size {size:6d}: Insert {metrics['insert_rate']:12.2f}/s, "
+                  f"Search {metrics['search_rate']:12.2f}/s, Miss {metrics['miss_rate']:12.2f}/s, "
+                  f"Prefix {metrics['prefix_rate']:10.2f}/s, Memory {int(metrics['memory']):10d} B")
+    print("="*80)
+
+def plot_results(results, output_dir, name='performance'):
+    """
+    Create plots from collected results, a dict mapping each source label to
+    its (size, insert_time, search_time) list, saved as <name>_results.png
+    and <name>_comparison.png with one series per source
+    """
+    if not results:
+        logger.error("No results to plot")
+        return
+    
+    all_sizes = [size for points in results.values() for size, _, _ in points]
+    logger.info(f"Plotting {len(all_sizes)} data points from {len(results)} sources")
+    logger.info(f"Size range: {min(all_sizes)} to {max(all_sizes)}")
     
     plt.figure(figsize=(12, 6))
     
     # Plot insertion times
     plt.subplot(1, 2, 1)
-    plt.plot(sizes, insert_times, 'b-o', markersize=6, linewidth=2)
+    for label, points in results.items():
+        sizes, insert_times, _ = zip(*points)
+        plt.plot(sizes, insert_times, '-o', label=label, markersize=6, linewidth=2)
     plt.title('TST Insertion Performance (HPC)', fontsize=14)
     plt.xlabel('Number of Words', fontsize=12)
     plt.ylabel('Time (seconds)', fontsize=12)
     plt.grid(True, alpha=0.3)
+    plt.legend(fontsize=10)
     plt.ticklabel_format(style='scientific', axis='y', scilimits=(0,0))
     
     # Plot search times
     plt.subplot(1, 2, 2)
-    plt.plot(sizes, search_times, 'r-o', markersize=6, linewidth=2)
+    for label, points in results.items():
+        sizes, _, search_times = zip(*points)
+        plt.plot(sizes, search_times, '-o', label=label, markersize=6, linewidth=2)
     plt.title('TST Search Performance (HPC)', fontsize=14)
     plt.xlabel('Number of Words', fontsize=12)
     plt.ylabel('Time (seconds)', fontsize=12)
     plt.grid(True, alpha=0.3)
+    plt.legend(fontsize=10)
     plt.ticklabel_format(style='scientific', axis='y', scilimits=(0,0))
     
     plt.tight_layout()
     
-    output_path = os.path.join(output_dir, 'performance_results.png')
+    output_path = os.path.join(output_dir, f'{name}_results.png')
     plt.savefig(output_path, dpi=300, bbox_inches='tight')
     logger.info(f"Plot saved to: {output_path}")
     
     # Also create a combined plot
     plt.figure(figsize=(10, 6))
-    plt.plot(sizes, insert_times, 'b-o', label='Insert', markersize=6, linewidth=2)
-    plt.plot(sizes, search_times, 'r-o', label='Search', markersize=6, linewidth=2)
+    for label, points in results.items():
+        sizes, insert_times, search_times = zip(*points)
+        plt.plot(sizes, insert_times, '-o', label=f'Insert ({label})', markersize=6, linewidth=2)
+        plt.plot(sizes, search_times, '--s', label=f'Search ({label})', markersize=6, linewidth=2)
     plt.title('TST Performance Comparison (HPC)', fontsize=14)
     plt.xlabel('Number of Words', fontsize=12)
     plt.ylabel('Time (seconds)', fontsize=12)
@@ -175,7 +310,7 @@ def plot_results(results, output_dir):
     plt.grid(True, alpha=0.3)
     plt.ticklabel_format(style='scientific', axis='y', scilimits=(0,0))
     
-    combined_path = os.path.join(output_dir, 'performance_comparison.png')
+    combined_path = os.path.join(output_dir, f'{name}_comparison.png')
     plt.savefig(combined_path, dpi=300, bbox_inches='tight')
     logger.info(f"Combined plot saved to: {combined_path}")
     
@@ -183,8 +318,10 @@ def plot_results(results, output_dir):
     print("\n" + "="*50)
     print("PERFORMANCE SUMMARY")
     print("="*50)
-    for size, insert_t, search_t in results:
-        print(f"Size {size:6d}: Insert {insert_t:.6f}s, Search {search_t:.6f}s")
+    for label, points in results.items():
+        print(label)
+        for size, insert_t, search_t in points:
+            print(f"Size {size:6d}: Insert {insert_t:.6f}s, Search {search_t:.6f}s")
     print("="*50)
 
 def main():
@@ -204,12 +341,27 @@ def main():
     
     # Collect and plot results
     results = collect_results(args.results_dir)
+    comparison = collect_comparison_results(args.results_dir)
+    scaling = collect_multiple_benchmark_results(args.results_dir, "scaling_results.txt")
+    
+    if comparison:
+        plot_comparison(comparison, args.results_dir)
+    
+    if scaling:
+        plot_results({'scaling_results.txt': scaling}, args.results_dir, name='scaling')
+    
+    if not results and (comparison or scaling):
+        logger.info("Plotting completed successfully")
+        return
     
     if not results:
         logger.error("No valid benchmark results found")
         logger.info("Expected files:")
         logger.info("  - benchmark_results.txt (from --sizes option)")
         logger.info("  - benchmark_size_*.txt (from --size option)")
+        logger.info("  - sweep_results.json (from benchmark_sweep.py)")
+        logger.info("  - comparison_results.txt (from --compare option)")
+        logger.info("  - scaling_results.txt (from --synthetic option)")
         sys.exit(1)
     
     plot_results(results, args.results_dir)
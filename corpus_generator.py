@@ -0,0 +1,114 @@
+import random
+from itertools import accumulate
+from typing import Iterator, List
+
+# English letters ordered from most to least frequent, used as the Zipf rank order
+ENGLISH_FREQUENCY_ORDER = 'etaoinshrdlcumwfgypbvkjxqz'
+
+LENGTH_DISTRIBUTIONS = ('fixed', 'uniform', 'normal')
+ORDERS = ('random', 'sorted', 'reverse')
+
+
+def zipf_cum_weights(n: int, exponent: float) -> List[float]:
+    """Return cumulative Zipf weights 1/rank**exponent for ranks 1..n"""
+    return list(accumulate(1.0 / rank ** exponent for rank in range(1, n + 1)))
+
+
+class CorpusGenerator:
+    """
+    Seeded generator of synthetic word corpora for scaling benchmarks.
+
+    Words are built from a Zipf-distributed alphabet. A fraction
+    shared_prefix_ratio of the words starts with a prefix drawn, again
+    Zipf-distributed, from a fixed pool of prefixes, so that the corpus has
+    the shared-prefix structure of real keys. The same seed and settings
+    always produce the same corpus.
+    """
+    def __init__(self, seed=None, alphabet=ENGLISH_FREQUENCY_ORDER,
+                 length_distribution='normal', min_length=3, max_length=14,
+                 mean_length=8.0, stddev_length=2.5, char_exponent=0.8,
+                 shared_prefix_ratio=0.6, prefix_pool_size=2000,
+                 prefix_exponent=1.1, min_prefix_length=2, max_prefix_length=5):
+        if length_distribution not in LENGTH_DISTRIBUTIONS:
+            raise ValueError(f"Unknown length distribution '{length_distribution}', "
+                             f"expected one of {LENGTH_DISTRIBUTIONS}")
+        if not 0.0 <= shared_prefix_ratio <= 1.0:
+            raise ValueError("shared_prefix_ratio must be between 0 and 1")
+        if not 1 <= min_length <= max_length:
+            raise ValueError("Word lengths must satisfy 1 <= min_length <= max_length")
+
+        self.seed = seed
+        self.alphabet = alphabet
+        self.length_distribution = length_distribution
+        self.min_length = min_length
+        self.max_length = max_length
+        self.mean_length = mean_length
+        self.stddev_length = stddev_length
+        self.shared_prefix_ratio = shared_prefix_ratio
+        self.min_prefix_length = min(min_prefix_length, max_length)
+        self.max_prefix_length = min(max_prefix_length, max_length)
+
+        self._rng = random.Random(seed)
+        self._char_cum_weights = zipf_cum_weights(len(alphabet), char_exponent)
+        self._prefixes = [self._random_string(self._rng.randint(self.min_prefix_length, self.max_prefix_length))
+                          for _ in range(prefix_pool_size)]
+        self._prefix_cum_weights = zipf_cum_weights(prefix_pool_size, prefix_exponent)
+
+    def _random_string(self, length: int) -> str:
+        """Helper method drawing length characters from the Zipf alphabet"""
+        return ''.join(self._rng.choices(self.alphabet, cum_weights=self._char_cum_weights, k=length))
+
+    def _random_length(self) -> int:
+        """Helper method drawing a word length from the configured distribution"""
+        if self.length_distribution == 'fixed':
+            length = round(self.mean_length)
+        elif self.length_distribution == 'uniform':
+            length = self._rng.randint(self.min_length, self.max_length)
+        else:
+            length = round(self._rng.gauss(self.mean_length, self.stddev_length))
+        return max(self.min_length, min(self.max_length, length))
+
+    def word(self) -> str:
+        """Generate a single word"""
+        length = self._random_length()
+        if self._prefixes and self._rng.random() < self.shared_prefix_ratio:
+            prefix = self._rng.choices(self._prefixes, cum_weights=self._prefix_cum_weights)[0][:length]
+            return prefix + self._random_string(length - len(prefix))
+        return self._random_string(length)
+
+    def stream(self, count: int, unique=True) -> Iterator[str]:
+        """
+        Yield count words in generation order.
+        With unique=True duplicates are skipped, which keeps a set of all words seen.
+        """
+        if not unique:
+            for _ in range(count):
+                yield self.word()
+            return
+
+        seen = set()
+        attempts = 0
+        while len(seen) < count:
+            word = self.word()
+            attempts += 1
+            if word not in seen:
+                seen.add(word)
+                yield word
+            elif attempts > 100 * count:
+                raise ValueError(f"Could only generate {len(seen)} unique words, "
+                                 f"widen the length range or lower the exponents")
+
+    def words(self, count: int, order='random', unique=True) -> Iterator[str]:
+        """
+        Yield count words in the requested order.
+
+        'random' streams words as they are generated. 'sorted' and 'reverse'
+        are the adversarial orders for a TST (they degenerate every level into
+        a linked list) and have to hold the whole corpus in memory to sort it.
+        """
+        if order not in ORDERS:
+            raise ValueError(f"Unknown order '{order}', expected one of {ORDERS}")
+        if order == 'random':
+            return self.stream(count, unique)
+        return iter(sorted(self.stream(count, unique), reverse=(order == 'reverse')))
+
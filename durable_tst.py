@@ -0,0 +1,256 @@
+import glob
+import heapq
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from ternary_search_tree import TernarySearchTree
+
+FSYNC_MODES = ('always', 'batch', 'never')
+
+_JOURNAL_PATTERN = re.compile(r'journal\.(\d+)\.log$')
+_CHECKPOINT_PATTERN = re.compile(r'checkpoint\.(\d+)\.txt$')
+
+
+def _journal_path(directory, seq):
+    return os.path.join(directory, f'journal.{seq:08d}.log')
+
+
+def _checkpoint_path(directory, seq):
+    return os.path.join(directory, f'checkpoint.{seq:08d}.txt')
+
+
+def _list_files(directory, pattern):
+    """Return (seq, path) of the files in directory matching pattern, in seq order"""
+    files = []
+    for path in glob.glob(os.path.join(directory, '*')):
+        match = pattern.search(os.path.basename(path))
+        if match:
+            files.append((int(match.group(1)), path))
+    return sorted(files)
+
+
+def _read_lines(path):
+    """Yield the complete lines of a file without their newline; a torn last line is skipped"""
+    with open(path, 'r', encoding='utf-8') as file:
+        for line in file:
+            if line.endswith('\n'):
+                yield line[:-1]
+
+
+def _fsync_directory(directory):
+    """Fsync directory so files created, renamed or removed in it survive a crash"""
+    if os.name == 'nt':
+        return  # Directories cannot be opened for fsync on Windows
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _check_word(word):
+    """Reject words that cannot be stored as a single UTF-8 journal line"""
+    if '\n' in word or '\r' in word:
+        raise ValueError(f"Words cannot contain line breaks: {word!r}")
+    word.encode('utf-8')  # Raises UnicodeEncodeError, e.g. for lone surrogates
+
+
+def recover(directory):
+    """
+    Rebuild a tree from the latest checkpoint plus the journals written after it
+
+    Returns the tree and the sequence number of the last journal found.
+    """
+    checkpoints = _list_files(directory, _CHECKPOINT_PATTERN)
+    if checkpoints:
+        checkpoint_seq, path = checkpoints[-1]
+        tst = TernarySearchTree.from_sorted(list(_read_lines(path)))
+    else:
+        checkpoint_seq = 0
+        tst = TernarySearchTree()
+
+    last_seq = checkpoint_seq
+    for seq, path in _list_files(directory, _JOURNAL_PATTERN):
+        if seq > checkpoint_seq:
+            tst.insert_many(_read_lines(path))
+        last_seq = max(last_seq, seq)
+    return tst, last_seq
+
+
+class DurableTST:
+    """
+    Ternary Search Tree that journals every new word to disk.
+
+    New words are appended, one per line, to the current journal file in
+    batches of batch_size. With fsync='always' every insert is written and
+    fsynced at once, with 'batch' every batch is fsynced, and with 'never'
+    batches are written but syncing is left to the operating system. Words
+    still buffered, or not yet fsynced, can be lost in a crash.
+
+    Every compact_every new words the journal is rotated and a background
+    thread folds the closed journal into a new sorted checkpoint by merging
+    it with the previous checkpoint on disk, so compaction never has to read
+    the live tree. Opening a directory recovers the tree from the latest
+    checkpoint plus the journals written after it.
+
+    Unless fsync='never', the directory is fsynced after each new journal is
+    created, so the file itself survives a crash and not only its contents. A
+    new checkpoint is always fsynced, and so is the directory after it is
+    renamed into place, before the files it replaces are removed.
+    """
+    def __init__(self, directory, fsync='batch', batch_size=1000, compact_every=100000):
+        if fsync not in FSYNC_MODES:
+            raise ValueError(f"Unknown fsync mode '{fsync}', expected one of {FSYNC_MODES}")
+        os.makedirs(directory, exist_ok=True)
+
+        self.directory = directory
+        self.fsync = fsync
+        self.batch_size = 1 if fsync == 'always' else batch_size
+        self.compact_every = compact_every
+        self.tree, last_seq = recover(directory)
+
+        self._buffer = []
+        self._journal_words = 0
+        self._seq = last_seq + 1
+        self._journal = self._open_journal()
+        self._compactor = ThreadPoolExecutor(max_workers=1)
+        self._compactions = []  # Submitted compactions not yet checked, the single worker runs them in order
+
+    def insert(self, word):
+        """Insert a word into the tree and journal it if it is new"""
+        if word:
+            _check_word(word)
+            if self.tree._insert_word(word):
+                self._log(word)
+
+    def insert_many(self, words):
+        """Insert all words from an iterable, journaling the new ones; returns the number of new words"""
+        added = 0
+        insert_word = self.tree._insert_word
+        for word in words:
+            if word:
+                _check_word(word)
+                if insert_word(word):
+                    self._log(word)
+                    added += 1
+        return added
+
+    def _log(self, word):
+        """Helper method buffering a new word for the journal"""
+        self._buffer.append(word)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write buffered words to the journal, fsyncing unless fsync='never'"""
+        if self._buffer:
+            self._journal.write('\n'.join(self._buffer) + '\n')
+            self._journal_words += len(self._buffer)
+            self._buffer = []
+            self._journal.flush()
+            if self.fsync != 'never':
+                os.fsync(self._journal.fileno())
+        if self._journal_words >= self.compact_every:
+            self._rotate()
+
+    def _rotate(self):
+        """Helper method closing the current journal, starting the next and compacting in the background"""
+        self._journal.close()
+        closed_seq = self._seq
+        self._seq += 1
+        self._journal_words = 0
+        self._journal = self._open_journal()
+        self._check_compactions()
+        self._compactions.append(self._compactor.submit(self._compact, closed_seq))
+
+    def _open_journal(self):
+        """Helper method creating the journal file for the current sequence number"""
+        journal = open(_journal_path(self.directory, self._seq), 'a', encoding='utf-8')
+        if self.fsync != 'never':
+            _fsync_directory(self.directory)
+        return journal
+
+    def _check_compactions(self):
+        """Helper method dropping finished compactions, raising the error of the first one that failed"""
+        pending = []
+        for compaction in self._compactions:
+            if compaction.done():
+                compaction.result()
+            else:
+                pending.append(compaction)
+        self._compactions = pending
+
+    def _compact(self, seq):
+        """Helper method folding all journals up to seq into a new checkpoint"""
+        checkpoints = _list_files(self.directory, _CHECKPOINT_PATTERN)
+        journals = [(s, path) for s, path in _list_files(self.directory, _JOURNAL_PATTERN) if s <= seq]
+        base_seq, base_path = checkpoints[-1] if checkpoints else (0, None)
+
+        new_words = set()
+        for s, path in journals:
+            if s > base_seq:
+                new_words.update(_read_lines(path))
+        base_words = _read_lines(base_path) if base_path else iter(())
+
+        # Write to a temporary file first so a crash never leaves a partial checkpoint
+        path = _checkpoint_path(self.directory, seq)
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            previous = None
+            for word in heapq.merge(base_words, sorted(new_words)):
+                if word != previous:
+                    file.write(word + '\n')
+                    previous = word
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+        _fsync_directory(self.directory)  # The rename must be durable before older files are removed
+
+        # The new checkpoint is complete, older files are no longer needed for recovery
+        for s, old_path in checkpoints:
+            os.remove(old_path)
+        for s, old_path in journals:
+            os.remove(old_path)
+
+    def checkpoint(self):
+        """Flush, fold everything journaled so far into a checkpoint and wait for it"""
+        self.flush()
+        if self._journal_words:
+            self._rotate()
+        self.wait_for_compaction()
+
+    def wait_for_compaction(self):
+        """Block until all background compactions have finished, raising the error of the first one that failed"""
+        compactions, self._compactions = self._compactions, []
+        for compaction in compactions:
+            compaction.result()
+
+    def close(self):
+        """Flush the journal, finish background compaction and close the journal file"""
+        self.flush()
+        self._compactor.shutdown(wait=True)
+        self._journal.close()
+        self.wait_for_compaction()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def search(self, word, exact=False):
+        """Search for a word in the tree, see TernarySearchTree.search"""
+        return self.tree.search(word, exact)
+
+    def keys_with_prefix(self, prefix):
+        """Return all strings in the tree that start with prefix, in sorted order"""
+        return self.tree.keys_with_prefix(prefix)
+
+    def all_strings(self):
+        """Return all strings stored in the tree"""
+        return self.tree.all_strings()
+
+    def __len__(self):
+        """Return the number of words in the tree"""
+        return len(self.tree)
@@ -0,0 +1,118 @@
+import numpy as np
+
+# Child index meaning "no child"
+NO_NODE = -1
+
+
+class FlatTST:
+    """
+    Ternary Search Tree compiled into flat NumPy arrays for batch lookups.
+
+    Node i has character code chars[i], children left[i], middle[i] and
+    right[i] (NO_NODE if absent) and is_end[i] set if a word ends there. The
+    root is node 0. The arrays are a snapshot: later inserts into the source
+    tree are not reflected.
+    """
+    def __init__(self, chars, left, middle, right, is_end):
+        self.chars = chars
+        self.left = left
+        self.middle = middle
+        self.right = right
+        self.is_end = is_end
+
+    @classmethod
+    def from_tree(cls, tst):
+        """Compile a TernarySearchTree into flat arrays, numbering nodes in depth-first order"""
+        chars, left, middle, right, is_end = [], [], [], [], []
+        if tst.root is not None:
+            # Each entry is (node, index of its parent's child slot to fill, which slot)
+            stack = [(tst.root, None, None)]
+            while stack:
+                node, parent, slot = stack.pop()
+                index = len(chars)
+                if parent is not None:
+                    slot[parent] = index
+                chars.append(ord(node.char))
+                left.append(NO_NODE)
+                middle.append(NO_NODE)
+                right.append(NO_NODE)
+                is_end.append(node.is_end_of_string)
+                for child, child_slot in ((node.right, right), (node.middle, middle), (node.left, left)):
+                    if child is not None:
+                        stack.append((child, index, child_slot))
+
+        return cls(np.array(chars, dtype=np.int32),
+                   np.array(left, dtype=np.int32),
+                   np.array(middle, dtype=np.int32),
+                   np.array(right, dtype=np.int32),
+                   np.array(is_end, dtype=bool))
+
+    def __len__(self):
+        """Return the number of words in the tree"""
+        return int(self.is_end.sum())
+
+    @property
+    def nr_nodes(self):
+        """Return the number of nodes in the tree"""
+        return len(self.chars)
+
+    @staticmethod
+    def encode(words):
+        """
+        Return the code points of words as a zero-padded matrix, and the word lengths
+
+        The code points are taken from one UTF-32 encoding of all words joined,
+        not from a NumPy string array, which would strip trailing '\\x00'.
+        """
+        words = [str(word) for word in words]
+        lengths = np.fromiter(map(len, words), dtype=np.int64, count=len(words))
+        width = max(int(lengths.max()), 1) if len(words) else 1
+        matrix = np.zeros((len(words), width), dtype=np.int32)
+        codes = np.frombuffer(''.join(words).encode('utf-32-le', 'surrogatepass'), dtype='<u4')
+        rows = np.repeat(np.arange(len(words)), lengths)
+        columns = np.arange(len(codes)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        matrix[rows, columns] = codes
+        return matrix, lengths
+
+    def search_many(self, words, exact=True):
+        """
+        Search all words at once, returns a boolean array matching
+        TernarySearchTree.search(word, exact) for every word
+
+        All active queries advance one node per step: the current character of
+        each query is compared with the character of its current node, and the
+        next node is gathered from left, middle or right. Queries leave the
+        active set when they fall off the tree or reach their last character.
+        """
+        matrix, lengths = self.encode(words)
+        found = np.zeros(len(lengths), dtype=bool)
+        if self.nr_nodes == 0:
+            return found
+        if not exact:
+            found[lengths == 0] = True  # The empty prefix matches any non-empty tree
+
+        active = np.flatnonzero(lengths > 0)
+        node = np.zeros(len(active), dtype=np.int32)
+        position = np.zeros(len(active), dtype=np.int64)
+        while len(active):
+            char = matrix[active, position]
+            node_char = self.chars[node]
+            less = char < node_char
+            greater = char > node_char
+            equal = ~(less | greater)
+
+            # Matched the last character: the query is answered
+            last = equal & (position == lengths[active] - 1)
+            if exact:
+                found[active[last]] = self.is_end[node[last]]
+            else:
+                found[active[last]] = True
+
+            next_node = np.where(less, self.left[node], np.where(greater, self.right[node], self.middle[node]))
+            position = position + (equal & ~last)
+
+            keep = ~last & (next_node != NO_NODE)
+            active = active[keep]
+            node = next_node[keep]
+            position = position[keep]
+        return found
@@ -5,15 +5,46 @@ import matplotlib.pyplot as plt
 import os
 import argparse
 import sys
+from itertools import islice
 from typing import List, Tuple
 import logging
+import tracemalloc
+import shutil
+import tempfile
 
 try:
     from ternary_search_tree import TernarySearchTree
+    from baseline_structures import SetBaseline, DictBaseline, SortedListBaseline, DictTrieBaseline
+    from durable_tst import DurableTST, FSYNC_MODES
+    from corpus_generator import CorpusGenerator, ORDERS, LENGTH_DISTRIBUTIONS, zipf_cum_weights
 except ImportError:
     print("Error: ternary_search_tree module not found")
     sys.exit(1)
 
+# Structures compared on the same workload by --compare
+STRUCTURES = {
+    'TST': TernarySearchTree,
+    'set': SetBaseline,
+    'dict': DictBaseline,
+    'sorted_list': SortedListBaseline,
+    'dict_trie': DictTrieBaseline,
+}
+
+# Number of prefix-enumeration queries per comparison run
+NR_PREFIX_QUERIES = 100
+
+# Number of substring queries per substring benchmark run
+NR_SUBSTRING_QUERIES = 100
+
+# Number of autocomplete queries per cache benchmark run
+NR_CACHE_QUERIES = 10000
+
+# Number of inserted words searched at each checkpoint of a scaling run
+NR_SCALING_QUERIES = 10000
+
+# Number of words pulled from the corpus generator at a time during a scaling run
+SCALING_CHUNK_SIZE = 100000
+
 # Setup logging to both console and file
 logging.basicConfig(
     level=logging.INFO,
@@ -61,6 +92,23 @@ def measure_insert_performance(words: List[str]) -> Tuple[float, TernarySearchTr
         logger.error(f"Error during insertion: {e}")
         raise
 
+def measure_ingest_performance(filename: str) -> Tuple[float, int]:
+    """Measure time taken to build a TST straight from a word file with TernarySearchTree.from_file"""
+    start_time = time.perf_counter()
+    tst = TernarySearchTree.from_file(filename)
+    end_time = time.perf_counter()
+    return end_time - start_time, len(tst)
+
+def write_ingest_results(f, word_file: str):
+    """Append file ingest time and rate for word_file to an open results file"""
+    if not word_file or not os.path.exists(word_file):
+        return
+    ingest_time, nr_words = measure_ingest_performance(word_file)
+    logger.info(f"Ingested {nr_words} words from {word_file} in {ingest_time:.6f}s")
+    f.write(f"File ingest: {nr_words} words from {word_file}\n")
+    f.write(f"Ingest time: {ingest_time:.6f}s\n")
+    f.write(f"Ingest rate: {nr_words/ingest_time:.2f} words/sec\n\n")
+
 def measure_search_performance(tst: TernarySearchTree, words: List[str]) -> float:
     """Measure time taken to search words in TST"""
     try:
@@ -73,7 +121,7 @@ def measure_search_performance(tst: TernarySearchTree, words: List[str]) -> floa
         logger.error(f"Error during search: {e}")
         raise
 
-def run_benchmark(size: int, output_dir: str, word_list: List[str] = None) -> Tuple[float, float]:
+def run_benchmark(size: int, output_dir: str, word_list: List[str] = None, word_file: str = None) -> Tuple[float, float]:
     """Run benchmark for specific size and save results"""
     try:
         words = generate_test_data(size, word_list=word_list)
@@ -92,6 +140,7 @@ def run_benchmark(size: int, output_dir: str, word_list: List[str] = None) -> Tu
             f.write(f"Search time: {search_time:.6f}s\n")
             f.write(f"Insert rate: {size/insert_time:.2f} words/sec\n")
             f.write(f"Search rate: {size/search_time:.2f} words/sec\n")
+            write_ingest_results(f, word_file)
         
         logger.info(f"Benchmark completed for size {size}")
         logger.info(f"Insert time: {insert_time:.6f}s, Search time: {search_time:.6f}s")
@@ -183,7 +232,8 @@ def measure_performance_with_samples(sizes: List[int], word_list: List[str], nr_
     logger.info("Performance measurement completed for all sizes")
     return times
 
-def run_multiple_benchmarks(sizes: List[int], output_dir: str, word_list: List[str], nr_runs: int = 10):
+def run_multiple_benchmarks(sizes: List[int], output_dir: str, word_list: List[str], nr_runs: int = 10,
+                            word_file: str = None):
     """Run benchmarks for multiple sizes with averaging"""
     try:
         logger.info(f"Starting benchmarks for sizes: {sizes}")
@@ -196,7 +246,8 @@ def run_multiple_benchmarks(sizes: List[int], output_dir: str, word_list: List[s
             raise ValueError("Word list is empty")
         
         if len(word_list) < max(sizes) + 100:
-            logger.error(f"Word list too small. Need at least {max(sizes) + 100} words, have {len(word_list)}")
+            logger.error(f"Word list too small. Need at least {max(sizes) + 100} words, have {len(word_list)}. "
+                         f"Use --synthetic for larger sizes")
             raise ValueError("Word list too small for requested sizes")
         
         logger.info("Starting performance measurement...")
@@ -213,6 +264,7 @@ def run_multiple_benchmarks(sizes: List[int], output_dir: str, word_list: List[s
             f.write("=" * 50 + "\n\n")
             f.write("Note: Insert times measured on empty TSTs\n")
             f.write("      Search times measured on TSTs with specified number of words\n\n")
+            write_ingest_results(f, word_file)
             for size in sizes:
                 f.write(f"Tree Size: {size} words\n")
                 f.write(f"Insert time: {times[size]['insert']:.6f}s\n")
@@ -230,6 +282,519 @@ def run_multiple_benchmarks(sizes: List[int], output_dir: str, word_list: List[s
         logger.error(f"Full traceback: {traceback.format_exc()}")
         raise
 
+def measure_structure_workload(factory, words: List[str], miss_words: List[str], prefixes: List[str]) -> dict:
+    """Time insert, exact search, miss search and prefix enumeration on a fresh structure"""
+    structure = factory()
+    start_time = time.perf_counter()
+    for word in words:
+        structure.insert(word)
+    insert_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    for word in words:
+        structure.search(word, exact=True)
+    search_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    for word in miss_words:
+        structure.search(word, exact=True)
+    miss_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    for prefix in prefixes:
+        structure.keys_with_prefix(prefix)
+    prefix_time = time.perf_counter() - start_time
+
+    return {'insert': insert_time, 'search': search_time, 'miss': miss_time, 'prefix': prefix_time}
+
+def measure_structure_memory(factory, words: List[str]) -> int:
+    """Measure bytes allocated by a structure holding words (words themselves excluded)"""
+    tracemalloc.start()
+    try:
+        structure = factory()
+        for word in words:
+            structure.insert(word)
+        memory, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return memory
+
+def generate_miss_words(word_list: List[str], excluded: set, count: int) -> List[str]:
+    """Pick words that are not in excluded, topping up with random words if needed"""
+    available = [w for w in word_list if w not in excluded]
+    misses = random.sample(available, k=min(count, len(available)))
+    while len(misses) < count:
+        word = generate_random_word(8)
+        if word not in excluded:
+            misses.append(word)
+    return misses
+
+def run_comparison(sizes: List[int], output_dir: str, word_list: List[str], nr_runs: int = 10) -> dict:
+    """
+    Run the same workload over the TST and each baseline structure.
+
+    For each size:
+    - Inserts 'size' sampled words into an empty structure
+    - Searches all inserted words (hits) and 'size' words that were not inserted (misses)
+    - Enumerates all words for NR_PREFIX_QUERIES three-letter prefixes of inserted words
+    - Measures memory held by the populated structure
+    """
+    if not word_list:
+        raise ValueError("Word list is empty")
+    if len(word_list) < max(sizes):
+        raise ValueError("Word list too small for requested sizes")
+
+    logger.info(f"Starting structure comparison for sizes: {sizes}")
+    results = {}
+    for size in sizes:
+        words = random.sample(word_list, k=size)
+        miss_words = generate_miss_words(word_list, set(words), size)
+        prefixes = [w[:3] for w in random.choices(words, k=NR_PREFIX_QUERIES)]
+
+        results[size] = {}
+        for name, factory in STRUCTURES.items():
+            totals = {'insert': 0.0, 'search': 0.0, 'miss': 0.0, 'prefix': 0.0}
+            for _ in range(nr_runs):
+                run_times = measure_structure_workload(factory, words, miss_words, prefixes)
+                for key in totals:
+                    totals[key] += run_times[key]
+            averages = {key: total / nr_runs for key, total in totals.items()}
+            results[size][name] = {
+                'insert_rate': size / averages['insert'],
+                'search_rate': size / averages['search'],
+                'miss_rate': len(miss_words) / averages['miss'],
+                'prefix_rate': len(prefixes) / averages['prefix'],
+                'memory': measure_structure_memory(factory, words),
+            }
+            logger.info(f"Size {size}, {name}: insert={results[size][name]['insert_rate']:.2f} words/sec, "
+                        f"memory={results[size][name]['memory']} bytes")
+
+    results_file = os.path.join(output_dir, "comparison_results.txt")
+    with open(results_file, 'w') as f:
+        f.write(f"Structure Comparison Results (averaged over {nr_runs} runs)\n")
+        f.write("=" * 50 + "\n\n")
+        f.write(f"Note: Miss rate measured on words not inserted, prefix rate on {NR_PREFIX_QUERIES} "
+                f"three-letter prefix enumerations\n\n")
+        for size in sizes:
+            for name, metrics in results[size].items():
+                f.write(f"Tree Size: {size} words\n")
+                f.write(f"Structure: {name}\n")
+                f.write(f"Insert rate: {metrics['insert_rate']:.2f} words/sec\n")
+                f.write(f"Search rate: {metrics['search_rate']:.2f} words/sec\n")
+                f.write(f"Miss rate: {metrics['miss_rate']:.2f} words/sec\n")
+                f.write(f"Prefix rate: {metrics['prefix_rate']:.2f} queries/sec\n")
+                f.write(f"Memory: {metrics['memory']} bytes\n")
+                f.write("-" * 30 + "\n")
+
+    logger.info(f"Comparison results saved to: {results_file}")
+    return results
+
+def run_substring_benchmark(sizes: List[int], output_dir: str, word_list: List[str], nr_runs: int = 10) -> dict:
+    """
+    Compare contains() on a suffix-indexed TST with a linear scan of all_strings().
+
+    For each size reports the build time and memory of a plain TST and of a
+    suffix-indexed TST, and the time for NR_SUBSTRING_QUERIES substring queries
+    (three-letter slices of inserted words) answered both ways.
+    """
+    if not word_list or len(word_list) < max(sizes):
+        raise ValueError("Word list too small for requested sizes")
+
+    logger.info(f"Starting substring benchmark for sizes: {sizes}")
+    results = {}
+    for size in sizes:
+        words = random.sample(word_list, k=size)
+        substrings = []
+        for word in random.choices(words, k=NR_SUBSTRING_QUERIES):
+            start = random.randint(0, max(0, len(word) - 3))
+            substrings.append(word[start:start + 3])
+
+        times = {'plain_build': 0.0, 'index_build': 0.0, 'scan': 0.0, 'contains': 0.0}
+        for _ in range(nr_runs):
+            start_time = time.perf_counter()
+            plain_tst = TernarySearchTree()
+            plain_tst.insert_many(words)
+            times['plain_build'] += time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            indexed_tst = TernarySearchTree(suffix_index=True)
+            indexed_tst.insert_many(words)
+            times['index_build'] += time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            all_words = plain_tst.all_strings()
+            for substring in substrings:
+                [w for w in all_words if substring in w]
+            times['scan'] += time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            for substring in substrings:
+                indexed_tst.contains(substring)
+            times['contains'] += time.perf_counter() - start_time
+
+        results[size] = {key: total / nr_runs for key, total in times.items()}
+        results[size]['plain_memory'] = measure_structure_memory(TernarySearchTree, words)
+        results[size]['index_memory'] = measure_structure_memory(lambda: TernarySearchTree(suffix_index=True), words)
+        logger.info(f"Size {size}: scan={results[size]['scan']:.6f}s, contains={results[size]['contains']:.6f}s, "
+                    f"memory {results[size]['plain_memory']} -> {results[size]['index_memory']} bytes")
+
+    results_file = os.path.join(output_dir, "substring_results.txt")
+    with open(results_file, 'w') as f:
+        f.write(f"Substring Query Results (averaged over {nr_runs} runs)\n")
+        f.write("=" * 50 + "\n\n")
+        f.write(f"Note: Query times are for {NR_SUBSTRING_QUERIES} three-letter substrings, answered by a linear\n")
+        f.write("      scan of all_strings() on a plain TST and by contains() on a suffix-indexed TST\n\n")
+        for size in sizes:
+            metrics = results[size]
+            f.write(f"Tree Size: {size} words\n")
+            f.write(f"Plain build time: {metrics['plain_build']:.6f}s\n")
+            f.write(f"Indexed build time: {metrics['index_build']:.6f}s\n")
+            f.write(f"Plain memory: {metrics['plain_memory']} bytes\n")
+            f.write(f"Indexed memory: {metrics['index_memory']} bytes\n")
+            f.write(f"Scan query time: {metrics['scan']:.6f}s\n")
+            f.write(f"Contains query time: {metrics['contains']:.6f}s\n")
+            f.write(f"Speedup: {metrics['scan']/metrics['contains']:.2f}x\n")
+            f.write("-" * 30 + "\n")
+
+    logger.info(f"Substring results saved to: {results_file}")
+    return results
+
+def measure_lookup_latency(tst: TernarySearchTree, words: List[str], nr_runs: int) -> float:
+    """Return the average exact-search latency over words in nanoseconds"""
+    start_time = time.perf_counter()
+    for _ in range(nr_runs):
+        for word in words:
+            tst.search(word, exact=True)
+    return (time.perf_counter() - start_time) / (nr_runs * len(words)) * 1e9
+
+def run_bloom_benchmark(sizes: List[int], output_dir: str, word_list: List[str], nr_runs: int = 10,
+                        false_positive_rate: float = 0.01) -> dict:
+    """
+    Compare exact-search latency of a plain TST and a TST with a Bloom filter.
+
+    For each size reports hit latency (inserted words) and miss latency (words
+    that were not inserted) separately, the filter's memory and its observed
+    false positive rate on the misses.
+    """
+    if not word_list or len(word_list) < max(sizes):
+        raise ValueError("Word list too small for requested sizes")
+
+    logger.info(f"Starting Bloom filter benchmark for sizes: {sizes}")
+    results = {}
+    for size in sizes:
+        words = random.sample(word_list, k=size)
+        miss_words = generate_miss_words(word_list, set(words), size)
+
+        plain_tst = TernarySearchTree()
+        plain_tst.insert_many(words)
+        bloom_tst = TernarySearchTree(bloom_filter=True, false_positive_rate=false_positive_rate)
+        bloom_tst.insert_many(words)
+
+        results[size] = {
+            'plain_hit': measure_lookup_latency(plain_tst, words, nr_runs),
+            'plain_miss': measure_lookup_latency(plain_tst, miss_words, nr_runs),
+            'bloom_hit': measure_lookup_latency(bloom_tst, words, nr_runs),
+            'bloom_miss': measure_lookup_latency(bloom_tst, miss_words, nr_runs),
+            'bloom_memory': bloom_tst.bloom.memory_bytes,
+            'false_positives': sum(word in bloom_tst.bloom for word in miss_words) / len(miss_words),
+        }
+        logger.info(f"Size {size}: miss latency {results[size]['plain_miss']:.0f}ns -> "
+                    f"{results[size]['bloom_miss']:.0f}ns, filter memory={results[size]['bloom_memory']} bytes")
+
+    results_file = os.path.join(output_dir, "bloom_results.txt")
+    with open(results_file, 'w') as f:
+        f.write(f"Bloom Filter Results (averaged over {nr_runs} runs, target false positive rate "
+                f"{false_positive_rate})\n")
+        f.write("=" * 50 + "\n\n")
+        f.write("Note: Hit latency measured on inserted words, miss latency on the same number of words\n")
+        f.write("      that were not inserted\n\n")
+        for size in sizes:
+            metrics = results[size]
+            f.write(f"Tree Size: {size} words\n")
+            f.write(f"Plain hit latency: {metrics['plain_hit']:.1f}ns\n")
+            f.write(f"Plain miss latency: {metrics['plain_miss']:.1f}ns\n")
+            f.write(f"Bloom hit latency: {metrics['bloom_hit']:.1f}ns\n")
+            f.write(f"Bloom miss latency: {metrics['bloom_miss']:.1f}ns\n")
+            f.write(f"Filter memory: {metrics['bloom_memory']} bytes\n")
+            f.write(f"Observed false positive rate: {metrics['false_positives']:.4f}\n")
+            f.write("-" * 30 + "\n")
+
+    logger.info(f"Bloom filter results saved to: {results_file}")
+    return results
+
+def generate_zipf_queries(words: List[str], nr_queries: int, rng: random.Random) -> List[Tuple[str, str]]:
+    """
+    Generate autocomplete queries skewed towards a few short prefixes.
+
+    Distinct one- to three-letter prefixes of words are ranked in random order
+    and drawn with Zipf weights; each query is a prefix search, a completion or
+    a count with equal probability.
+    """
+    prefixes = sorted({w[:length] for w in words for length in (1, 2, 3)})
+    rng.shuffle(prefixes)
+    cum_weights = zipf_cum_weights(len(prefixes), 1.0)
+    kinds = ('search', 'keys_with_prefix', 'count_with_prefix')
+    return [(rng.choice(kinds), prefix)
+            for prefix in rng.choices(prefixes, cum_weights=cum_weights, k=nr_queries)]
+
+def run_cache_benchmark(sizes: List[int], output_dir: str, word_list: List[str], nr_runs: int = 10,
+                        cache_size: int = 256) -> dict:
+    """
+    Compare Zipfian autocomplete traffic on a TST with and without a query cache.
+
+    Each run starts from a cold cache, so the reported hit rate and latency
+    include the misses needed to fill it.
+    """
+    if not word_list or len(word_list) < max(sizes):
+        raise ValueError("Word list too small for requested sizes")
+
+    logger.info(f"Starting cache benchmark for sizes: {sizes} (cache size {cache_size})")
+    rng = random.Random(0)
+    results = {}
+    for size in sizes:
+        words = random.sample(word_list, k=size)
+        queries = generate_zipf_queries(words, NR_CACHE_QUERIES, rng)
+
+        times = {'plain': 0.0, 'cached': 0.0}
+        for _ in range(nr_runs):
+            for name, tst in (('plain', TernarySearchTree()), ('cached', TernarySearchTree(cache_size=cache_size))):
+                tst.insert_many(words)
+                start_time = time.perf_counter()
+                for method, prefix in queries:
+                    getattr(tst, method)(prefix)
+                times[name] += time.perf_counter() - start_time
+        stats = tst.cache.stats()
+
+        results[size] = {
+            'plain_latency': times['plain'] / (nr_runs * len(queries)) * 1e6,
+            'cached_latency': times['cached'] / (nr_runs * len(queries)) * 1e6,
+            **stats,
+        }
+        logger.info(f"Size {size}: latency {results[size]['plain_latency']:.2f}us -> "
+                    f"{results[size]['cached_latency']:.2f}us, hit rate={stats['hit_rate']:.3f}")
+
+    results_file = os.path.join(output_dir, "cache_results.txt")
+    with open(results_file, 'w') as f:
+        f.write(f"Query Cache Results (averaged over {nr_runs} runs, cache size {cache_size})\n")
+        f.write("=" * 50 + "\n\n")
+        f.write(f"Note: {NR_CACHE_QUERIES} Zipf-distributed prefix, completion and count queries per run,\n")
+        f.write("      cache statistics are for the last run, starting from an empty cache\n\n")
+        for size in sizes:
+            metrics = results[size]
+            f.write(f"Tree Size: {size} words\n")
+            f.write(f"Plain latency: {metrics['plain_latency']:.3f}us/query\n")
+            f.write(f"Cached latency: {metrics['cached_latency']:.3f}us/query\n")
+            f.write(f"Hit rate: {metrics['hit_rate']:.4f}\n")
+            f.write(f"Evictions: {metrics['evictions']}\n")
+            f.write(f"Cache memory: {metrics['memory_bytes']} bytes for {metrics['size']} entries\n")
+            f.write("-" * 30 + "\n")
+
+    logger.info(f"Cache results saved to: {results_file}")
+    return results
+
+def run_batch_benchmark(sizes: List[int], output_dir: str, word_list: List[str], nr_runs: int = 10) -> dict:
+    """
+    Compare per-word exact search with the vectorized batch search of a FlatTST.
+
+    For each size the queries are the inserted words plus the same number of
+    words that were not inserted. Per-word search is timed with
+    measure_search_performance; the batch results are checked against it.
+    """
+    from flat_tst import FlatTST  # Needs NumPy, which only this benchmark uses
+
+    if not word_list or len(word_list) < max(sizes):
+        raise ValueError("Word list too small for requested sizes")
+
+    logger.info(f"Starting batch search benchmark for sizes: {sizes}")
+    results = {}
+    for size in sizes:
+        words = random.sample(word_list, k=size)
+        queries = words + generate_miss_words(word_list, set(words), size)
+        random.shuffle(queries)
+        tst = TernarySearchTree()
+        tst.insert_many(words)
+
+        start_time = time.perf_counter()
+        flat = FlatTST.from_tree(tst)
+        compile_time = time.perf_counter() - start_time
+
+        expected = [tst.search(word, exact=True) for word in queries]
+        if flat.search_many(queries).tolist() != expected:
+            raise AssertionError(f"Batch search results differ from search for size {size}")
+
+        times = {'single': 0.0, 'batch': 0.0}
+        for _ in range(nr_runs):
+            times['single'] += measure_search_performance(tst, queries)
+            start_time = time.perf_counter()
+            flat.search_many(queries)
+            times['batch'] += time.perf_counter() - start_time
+
+        results[size] = {
+            'compile_time': compile_time,
+            'single_rate': nr_runs * len(queries) / times['single'],
+            'batch_rate': nr_runs * len(queries) / times['batch'],
+            'nodes': flat.nr_nodes,
+        }
+        logger.info(f"Size {size}: {results[size]['single_rate']:.2f} -> "
+                    f"{results[size]['batch_rate']:.2f} lookups/sec")
+
+    results_file = os.path.join(output_dir, "batch_results.txt")
+    with open(results_file, 'w') as f:
+        f.write(f"Batch Search Results (averaged over {nr_runs} runs)\n")
+        f.write("=" * 50 + "\n\n")
+        f.write("Note: Queries are the inserted words plus as many words that were not inserted\n\n")
+        for size in sizes:
+            metrics = results[size]
+            f.write(f"Tree Size: {size} words\n")
+            f.write(f"Nodes: {metrics['nodes']}\n")
+            f.write(f"Compile time: {metrics['compile_time']:.6f}s\n")
+            f.write(f"Per-word search rate: {metrics['single_rate']:.2f} words/sec\n")
+            f.write(f"Batch search rate: {metrics['batch_rate']:.2f} words/sec\n")
+            f.write(f"Speedup: {metrics['batch_rate']/metrics['single_rate']:.2f}x\n")
+            f.write("-" * 30 + "\n")
+
+    logger.info(f"Batch search results saved to: {results_file}")
+    return results
+
+def run_durability_benchmark(sizes: List[int], output_dir: str, fsync: str = 'batch', batch_size: int = 1000,
+                             seed: int = 42) -> dict:
+    """
+    Measure the write-path overhead and recovery time of a DurableTST.
+
+    For each number of mutations, synthetic words are inserted into a plain
+    TST and into a DurableTST, once with background compaction every 10% of
+    the mutations and once without compaction. Recovery is then timed for
+    both directories: checkpoint load plus a short journal replay, versus
+    replaying the full journal.
+    """
+    logger.info(f"Starting durability benchmark for sizes: {sizes} (fsync={fsync}, batch size {batch_size})")
+    results = {}
+    for size in sizes:
+        words = list(CorpusGenerator(seed=seed).words(size))
+
+        start_time = time.perf_counter()
+        TernarySearchTree().insert_many(words)
+        plain_time = time.perf_counter() - start_time
+
+        metrics = {'plain_insert': plain_time}
+        for name, compact_every in (('compacted', max(1, size // 10)), ('journal_only', size + 1)):
+            directory = tempfile.mkdtemp(prefix='durable_', dir=output_dir)
+            try:
+                durable = DurableTST(directory, fsync=fsync, batch_size=batch_size, compact_every=compact_every)
+                start_time = time.perf_counter()
+                durable.insert_many(words)
+                durable.flush()
+                metrics[f'{name}_insert'] = time.perf_counter() - start_time
+                durable.close()
+                metrics[f'{name}_close'] = time.perf_counter() - start_time - metrics[f'{name}_insert']
+
+                start_time = time.perf_counter()
+                recovered = DurableTST(directory)
+                metrics[f'{name}_recovery'] = time.perf_counter() - start_time
+                if len(recovered) != size:
+                    raise AssertionError(f"Recovered {len(recovered)} words, expected {size}")
+                recovered.close()
+            finally:
+                shutil.rmtree(directory, ignore_errors=True)
+
+        results[size] = metrics
+        logger.info(f"Size {size}: insert {plain_time:.3f}s plain, {metrics['compacted_insert']:.3f}s durable, "
+                    f"recovery {metrics['compacted_recovery']:.3f}s (checkpoint) / "
+                    f"{metrics['journal_only_recovery']:.3f}s (journal only)")
+
+    results_file = os.path.join(output_dir, "durability_results.txt")
+    with open(results_file, 'w') as f:
+        f.write(f"Durability Results (fsync={fsync}, batch size {batch_size}, synthetic corpus seed {seed})\n")
+        f.write("=" * 50 + "\n\n")
+        f.write("Note: Compacted runs fold the journal into a checkpoint every 10% of the mutations,\n")
+        f.write("      close time is the wait for the last background compaction\n\n")
+        for size in sizes:
+            metrics = results[size]
+            f.write(f"Mutations: {size}\n")
+            f.write(f"Plain insert time: {metrics['plain_insert']:.6f}s\n")
+            f.write(f"Durable insert time: {metrics['compacted_insert']:.6f}s\n")
+            f.write(f"Durable insert time (no compaction): {metrics['journal_only_insert']:.6f}s\n")
+            f.write(f"Write-path overhead: {metrics['compacted_insert']/metrics['plain_insert'] - 1:.1%}\n")
+            f.write(f"Close time: {metrics['compacted_close']:.6f}s\n")
+            f.write(f"Recovery time (checkpoint + journal): {metrics['compacted_recovery']:.6f}s\n")
+            f.write(f"Recovery time (journal replay only): {metrics['journal_only_recovery']:.6f}s\n")
+            f.write("-" * 30 + "\n")
+
+    logger.info(f"Durability results saved to: {results_file}")
+    return results
+
+def run_scaling_benchmark(sizes: List[int], output_dir: str, generator: CorpusGenerator, order: str = 'random'):
+    """
+    Stream a synthetic corpus into a single TST and measure it at each size.
+
+    Words are inserted in the requested order until each size has been
+    inserted in turn. At every checkpoint the cumulative insert time is
+    recorded and a fixed-size uniform sample of the words inserted so far
+    (kept by reservoir sampling) is searched. The corpus is generated without
+    deduplication and the tree drops repeated words, so the reported tree size
+    is measured from the tree and can be below the number of words inserted.
+    Words are pulled in chunks, so in 'random' order only the tree, one chunk
+    and the query sample are held in memory.
+    """
+    sizes = sorted(sizes)
+    logger.info(f"Starting scaling benchmark for sizes: {sizes} (order={order}, seed={generator.seed})")
+    rng = random.Random(generator.seed)
+    tst = TernarySearchTree()
+    query_sample = []
+    times = {}
+    inserted = 0
+    insert_time = 0.0
+    words = generator.words(sizes[-1], order=order, unique=False)
+
+    for size in sizes:
+        while inserted < size:
+            chunk = list(islice(words, min(SCALING_CHUNK_SIZE, size - inserted)))
+
+            # Reservoir sampling of the query words is kept outside the timed section
+            for word in chunk:
+                if len(query_sample) < NR_SCALING_QUERIES:
+                    query_sample.append(word)
+                else:
+                    j = rng.randint(0, inserted)
+                    if j < NR_SCALING_QUERIES:
+                        query_sample[j] = word
+                inserted += 1
+
+            start_time = time.perf_counter()
+            for word in chunk:
+                tst.insert(word)
+            insert_time += time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        for word in query_sample:
+            tst.search(word, exact=True)
+        search_time = time.perf_counter() - start_time
+        tree_size = len(tst)
+
+        times[size] = {'insert': insert_time, 'search': search_time, 'queries': len(query_sample),
+                       'tree_size': tree_size}
+        logger.info(f"Size {size}: {tree_size} distinct words, cumulative insert={insert_time:.6f}s, "
+                    f"search of {len(query_sample)} words={search_time:.6f}s")
+
+    results_file = os.path.join(output_dir, "scaling_results.txt")
+    with open(results_file, 'w') as f:
+        f.write(f"Scaling Benchmark Results (synthetic corpus, order={order}, seed={generator.seed})\n")
+        f.write("=" * 50 + "\n\n")
+        f.write("Note: Insert times are cumulative times to insert the given number of words\n")
+        f.write("      Tree Size counts distinct words, repeated words are dropped by the tree\n")
+        f.write(f"      Search times measured for up to {NR_SCALING_QUERIES} inserted words\n\n")
+        for size in sizes:
+            f.write(f"Tree Size: {times[size]['tree_size']} words\n")
+            f.write(f"Words inserted: {size}\n")
+            f.write(f"Insert time: {times[size]['insert']:.6f}s\n")
+            f.write(f"Search time: {times[size]['search']:.6f}s\n")
+            f.write(f"Insert rate: {size/times[size]['insert']:.2f} words/sec\n")
+            f.write(f"Search rate: {times[size]['queries']/times[size]['search']:.2f} words/sec\n")
+            f.write("-" * 30 + "\n")
+
+    logger.info(f"Scaling results saved to: {results_file}")
+    return times
+
 def main():
     parser = argparse.ArgumentParser(description='Run TST performance benchmarks')
     parser.add_argument('--size', type=int, help='Number of words to test (single benchmark)')
@@ -238,6 +803,33 @@ def main():
     parser.add_argument('--word-file', type=str, default='data/search_trees/corncob_lowercase.txt', 
                        help='Path to word list file')
     parser.add_argument('--runs', type=int, default=10, help='Number of runs for averaging')
+    parser.add_argument('--compare', action='store_true',
+                       help='Run the same workload over TST, set, dict, sorted list and dict trie')
+    parser.add_argument('--substring', action='store_true',
+                       help='Compare contains() on a suffix-indexed TST with a linear scan')
+    parser.add_argument('--bloom', action='store_true',
+                       help='Compare hit and miss latency with and without a Bloom filter')
+    parser.add_argument('--false-positive-rate', type=float, default=0.01,
+                       help='Target false positive rate of the Bloom filter')
+    parser.add_argument('--cache', action='store_true',
+                       help='Compare Zipfian autocomplete queries with and without the query cache')
+    parser.add_argument('--cache-size', type=int, default=256, help='Number of entries in the query cache')
+    parser.add_argument('--batch', action='store_true',
+                       help='Compare per-word search with NumPy batch search over a flattened TST')
+    parser.add_argument('--durable', action='store_true',
+                       help='Measure journaling overhead and recovery time of a DurableTST (sizes are mutations)')
+    parser.add_argument('--fsync', choices=FSYNC_MODES, default='batch', help='Journal fsync mode for --durable')
+    parser.add_argument('--journal-batch-size', type=int, default=1000,
+                       help='Number of words written to the journal at once for --durable')
+    parser.add_argument('--synthetic', action='store_true',
+                       help='Stream a synthetic corpus into one growing TST instead of sampling the word file')
+    parser.add_argument('--seed', type=int, default=42, help='Seed for the synthetic corpus')
+    parser.add_argument('--order', choices=ORDERS, default='random',
+                       help='Insertion order of the synthetic corpus (sorted and reverse are adversarial)')
+    parser.add_argument('--length-distribution', choices=LENGTH_DISTRIBUTIONS, default='normal',
+                       help='Word length distribution of the synthetic corpus')
+    parser.add_argument('--shared-prefix-ratio', type=float, default=0.6,
+                       help='Fraction of synthetic words starting with a prefix from the shared pool')
     
     args = parser.parse_args()
     
@@ -251,18 +843,50 @@ def main():
         logger.error(f"Error creating output directory: {e}")
         sys.exit(1)
     
+    try:
+        if args.durable:
+            # Journaled tree, no word file needed
+            run_durability_benchmark(args.sizes or [args.size], args.output_dir, args.fsync,
+                                     args.journal_batch_size, args.seed)
+            return
+        if args.synthetic:
+            # Scaling benchmark on a generated corpus, no word file needed
+            generator = CorpusGenerator(seed=args.seed, length_distribution=args.length_distribution,
+                                        shared_prefix_ratio=args.shared_prefix_ratio)
+            run_scaling_benchmark(args.sizes or [args.size], args.output_dir, generator, args.order)
+            return
+    except Exception as e:
+        logger.error(f"Benchmark failed: {e}")
+        sys.exit(1)
+    
     # Load word list
     word_list = load_word_list(args.word_file)
     
     try:
-        if args.size:
+        if args.batch:
+            # Vectorized batch lookups over a FlatTST
+            run_batch_benchmark(args.sizes or [args.size], args.output_dir, word_list, args.runs)
+        elif args.cache:
+            # LRU cache for prefix queries
+            run_cache_benchmark(args.sizes or [args.size], args.output_dir, word_list, args.runs, args.cache_size)
+        elif args.bloom:
+            # Bloom filter in front of exact search
+            run_bloom_benchmark(args.sizes or [args.size], args.output_dir, word_list, args.runs,
+                                args.false_positive_rate)
+        elif args.substring:
+            # Suffix index against linear scan
+            run_substring_benchmark(args.sizes or [args.size], args.output_dir, word_list, args.runs)
+        elif args.compare:
+            # Side-by-side comparison with baseline structures
+            run_comparison(args.sizes or [args.size], args.output_dir, word_list, args.runs)
+        elif args.size:
             # Single benchmark
             if not word_list:
                 logger.warning("No word list available, using random words")
-            run_benchmark(args.size, args.output_dir, word_list)
+            run_benchmark(args.size, args.output_dir, word_list, args.word_file)
         else:
             # Multiple benchmarks
-            run_multiple_benchmarks(args.sizes, args.output_dir, word_list, args.runs)
+            run_multiple_benchmarks(args.sizes, args.output_dir, word_list, args.runs, args.word_file)
             
     except Exception as e:
         logger.error(f"Benchmark failed: {e}")
@@ -0,0 +1,87 @@
+import sys
+from collections import OrderedDict
+
+# Kinds of prefix query results held by the cache
+PREFIX = 'prefix'
+COMPLETION = 'completion'
+COUNT = 'count'
+KINDS = (PREFIX, COMPLETION, COUNT)
+
+
+class QueryCache:
+    """
+    Bounded LRU cache for prefix query results.
+
+    Entries are keyed by (kind, prefix). Inserting a word can only change the
+    result for prefixes of that word, so invalidate(word) drops just the
+    entries of those prefixes instead of clearing the cache.
+    """
+    def __init__(self, maxsize):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, kind, prefix, default=None):
+        """Return the cached result for (kind, prefix) and mark it recently used, or default"""
+        key = (kind, prefix)
+        try:
+            value = self.entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, kind, prefix, value):
+        """Store the result for (kind, prefix), evicting the least recently used entry when full"""
+        key = (kind, prefix)
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, word):
+        """Drop all entries whose prefix lies on the path of word"""
+        entries = self.entries
+        for end in range(len(word) + 1):
+            prefix = word[:end]
+            for kind in KINDS:
+                if entries.pop((kind, prefix), None) is not None:
+                    self.invalidations += 1
+
+    def clear(self):
+        """Drop all entries, keeping the statistics"""
+        self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def memory_bytes(self):
+        """Return an estimate of the memory held by the cached keys and results"""
+        total = sys.getsizeof(self.entries)
+        for (kind, prefix), value in self.entries.items():
+            total += sys.getsizeof(prefix) + sys.getsizeof(value)
+            if isinstance(value, list):
+                total += sum(sys.getsizeof(word) for word in value)
+        return total
+
+    def stats(self):
+        """Return hit rate, eviction and invalidation counts, size and memory estimate"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'size': len(self.entries),
+            'maxsize': self.maxsize,
+            'memory_bytes': self.memory_bytes(),
+        }
@@ -1,3 +1,23 @@
+from itertools import islice
+
+from bloom_filter import BloomFilter
+from query_cache import QueryCache, PREFIX, COMPLETION, COUNT
+
+# Number of words inserted per batch by insert_many
+BATCH_SIZE = 65536
+
+# Approximate number of bytes read per chunk by from_file
+CHUNK_BYTES = 1 << 20
+
+# Initial capacity of the Bloom filter, it is rebuilt with double capacity when full
+BLOOM_INITIAL_CAPACITY = 1024
+
+# Set operations supported by the lockstep merge of two trees
+_UNION = 'union'
+_INTERSECTION = 'intersection'
+_DIFFERENCE = 'difference'
+
+
 class TSTNode:
     """Node class for Ternary Search Tree"""
     def __init__(self, char):
@@ -8,20 +28,69 @@ class TSTNode:
         self.is_end_of_string = False
 
 
+class SuffixTSTNode(TSTNode):
+    """Node class for the suffix index, end nodes reference the words the suffix came from"""
+    def __init__(self, char):
+        super().__init__(char)
+        self.words = None  # Words having this suffix, only set on end nodes
+
+
 class TernarySearchTree:
     """
     Ternary Search Tree implementation for string operations.
+
+    With suffix_index=True every suffix of every inserted word is also stored
+    in a SuffixIndex, which answers substring queries with contains().
+
+    With bloom_filter=True inserted words are also added to a BloomFilter with
+    the given false_positive_rate, which lets exact searches reject most
+    missing words without visiting any node.
+
+    With cache_size > 0 the results of prefix searches, keys_with_prefix and
+    count_with_prefix are kept in a QueryCache of that many entries. Inserting
+    a new word only invalidates the cached results for prefixes of that word.
     """
-    def __init__(self):
+    node_class = TSTNode
+
+    def __init__(self, suffix_index=False, bloom_filter=False, false_positive_rate=0.01, cache_size=0):
         self.root = None
+        self.suffixes = SuffixIndex() if suffix_index else None
+        self.bloom = BloomFilter(BLOOM_INITIAL_CAPACITY, false_positive_rate) if bloom_filter else None
+        self.cache = QueryCache(cache_size) if cache_size else None
 
     def insert(self, word):
         """
         Insert a word into the tree
 
         """
-        if word:
+        if not word:
+            return
+        if not self._has_indexes():
             self.root = self._insert(self.root, word)
+        elif self._insert_word(word):
+            self._index_word(word)
+
+    def _has_indexes(self):
+        """Helper method returning True if new words also have to be passed to _index_word"""
+        return self.suffixes is not None or self.bloom is not None or self.cache is not None
+
+    def _index_word(self, word):
+        """Helper method adding a new word to the suffix index, Bloom filter and query cache, if enabled"""
+        if self.cache is not None:
+            self.cache.invalidate(word)
+        if self.suffixes is not None:
+            self.suffixes.add(word)
+        if self.bloom is not None:
+            self.bloom.add(word)
+            if len(self.bloom) > self.bloom.capacity:
+                self._grow_bloom()
+
+    def _grow_bloom(self):
+        """Helper method rebuilding the Bloom filter with double capacity from the stored words"""
+        bloom = BloomFilter(2 * self.bloom.capacity, self.bloom.false_positive_rate)
+        for word in self.all_strings():
+            bloom.add(word)
+        self.bloom = bloom
 
     def _insert(self, node, word):
         """Helper method for insertion"""
@@ -39,12 +108,188 @@ class TernarySearchTree:
                 node.is_end_of_string = True
         return node
 
+    def insert_many(self, words):
+        """
+        Insert all words from an iterable, returns the number of new words
+
+        Words are consumed in batches of BATCH_SIZE, so the iterable may be a
+        stream. Empty words and duplicates within a batch are skipped before
+        they reach the tree.
+        """
+        added = 0
+        words = iter(words)
+        insert_word = self._insert_word
+        while True:
+            batch = dict.fromkeys(islice(words, BATCH_SIZE))
+            if not batch:
+                return added
+            batch.pop('', None)
+            if not self._has_indexes():
+                for word in batch:
+                    added += insert_word(word)
+            else:
+                for word in batch:
+                    if insert_word(word):
+                        self._index_word(word)
+                        added += 1
+
+    def _insert_word(self, word):
+        """Helper method for iterative insertion, returns True if word was not stored yet"""
+        node = self._insert_node(word)
+        is_new = not node.is_end_of_string
+        node.is_end_of_string = True
+        return is_new
+
+    def _insert_node(self, word):
+        """Helper method creating the path for word where needed, returns its last node"""
+        node_class = self.node_class
+        node = self.root
+        if node is None:
+            node = self.root = node_class(word[0])
+        i = 0
+        last = len(word) - 1
+        while True:
+            char = word[i]
+            if char < node.char:
+                if node.left is None:
+                    node.left = node_class(char)
+                node = node.left
+            elif char > node.char:
+                if node.right is None:
+                    node.right = node_class(char)
+                node = node.right
+            elif i == last:
+                return node
+            else:
+                i += 1
+                if node.middle is None:
+                    node.middle = node_class(word[i])
+                node = node.middle
+
+    @classmethod
+    def from_file(cls, path, encoding='utf-8'):
+        """
+        Build a tree from a file with one word per line
+
+        The file is read in chunks of about CHUNK_BYTES, so apart from the tree
+        only one chunk is held in memory. Lines are stripped and blank lines skipped.
+        """
+        tst = cls()
+        tst.insert_many(_read_words(path, encoding))
+        return tst
+
+    @classmethod
+    def from_sorted(cls, words):
+        """
+        Build a balanced tree from a sorted list of unique words
+
+        Inserting the median first and then recursing on both halves keeps
+        every level of the tree balanced, unlike inserting in sorted order.
+        """
+        tst = cls()
+        tst._insert_balanced(words, 0, len(words))
+        return tst
+
+    def _insert_balanced(self, words, lo, hi):
+        """Helper method inserting words[lo:hi] median first"""
+        if lo >= hi:
+            return
+        mid = (lo + hi) // 2
+        if words[mid]:
+            self._insert_word(words[mid])
+        self._insert_balanced(words, lo, mid)
+        self._insert_balanced(words, mid + 1, hi)
+
+    def union(self, other):
+        """Return a new balanced tree with the words stored in either tree"""
+        return self._set_operation(other, _UNION)
+
+    def intersection(self, other):
+        """Return a new balanced tree with the words stored in both trees"""
+        return self._set_operation(other, _INTERSECTION)
+
+    def difference(self, other):
+        """Return a new balanced tree with the words of this tree that are not in other"""
+        return self._set_operation(other, _DIFFERENCE)
+
+    def issubset(self, other):
+        """Return True if every word of this tree is also stored in other"""
+        return self._is_subset(self.root, other.root)
+
+    def _set_operation(self, other, operation):
+        """
+        Helper method for set operations
+
+        Both trees are walked in lockstep, one level of characters at a time and
+        in sorted order. Subtrees that cannot contribute to the result are skipped
+        without being visited, and the sorted result is bulk built with from_sorted.
+        """
+        result = []
+        self._merge_levels(self.root, other.root, '', operation, result)
+        return type(self).from_sorted(result)
+
+    def _collect_node(self, node, prefix, result):
+        """Helper method appending the word ending at node, if any, and all words below it"""
+        word = prefix + node.char
+        if node.is_end_of_string:
+            result.append(word)
+        self._traverse(node.middle, list(word), len(word), result)
+
+    def _merge_levels(self, a, b, prefix, operation, result):
+        """Helper method appending the words below levels a and b that belong to the result, in sorted order"""
+        nodes_a = _level_nodes(a)
+        nodes_b = _level_nodes(b)
+        node_a = next(nodes_a, None)
+        node_b = next(nodes_b, None)
+        while node_a is not None or node_b is not None:
+            if node_b is None or (node_a is not None and node_a.char < node_b.char):
+                # Only in a
+                if operation != _INTERSECTION:
+                    self._collect_node(node_a, prefix, result)
+                node_a = next(nodes_a, None)
+            elif node_a is None or node_b.char < node_a.char:
+                # Only in b
+                if operation == _UNION:
+                    self._collect_node(node_b, prefix, result)
+                node_b = next(nodes_b, None)
+            else:
+                word = prefix + node_a.char
+                end_a = node_a.is_end_of_string
+                end_b = node_b.is_end_of_string
+                if operation == _UNION:
+                    keep = end_a or end_b
+                elif operation == _INTERSECTION:
+                    keep = end_a and end_b
+                else:
+                    keep = end_a and not end_b
+                if keep:
+                    result.append(word)
+                self._merge_levels(node_a.middle, node_b.middle, word, operation, result)
+                node_a = next(nodes_a, None)
+                node_b = next(nodes_b, None)
+
+    def _is_subset(self, a, b):
+        """Helper method returning True if every word below level a is also below level b"""
+        nodes_b = _level_nodes(b)
+        node_b = next(nodes_b, None)
+        for node_a in _level_nodes(a):
+            while node_b is not None and node_b.char < node_a.char:
+                node_b = next(nodes_b, None)
+            # Nodes are only created by inserts, so every node of a leads to at least one word
+            if node_b is None or node_b.char != node_a.char:
+                return False
+            if node_a.is_end_of_string and not node_b.is_end_of_string:
+                return False
+            if not self._is_subset(node_a.middle, node_b.middle):
+                return False
+        return True
+
     def all_strings(self):
         """
         Return all strings stored in the tree
         """
         result = []
-        buffer = [''] * 100  # Buffer for string building
+        buffer = []  # Buffer for string building, grows with the deepest word
         self._traverse(self.root, buffer, 0, result)
         return result
 
@@ -54,7 +299,10 @@ class TernarySearchTree:
             return
 
         self._traverse(node.left, buffer, depth, result)
-        buffer[depth] = node.char
+        if depth == len(buffer):
+            buffer.append(node.char)
+        else:
+            buffer[depth] = node.char
         if node.is_end_of_string:
             result.append("".join(buffer[:depth + 1]))
         self._traverse(node.middle, buffer, depth + 1, result)
@@ -88,9 +336,27 @@ class TernarySearchTree:
             exact: If True, only exact matches are returned
                   If False, prefix matches are allowed
         """
-        if not word and not exact:
+        if exact:
+            if self.bloom is not None and word not in self.bloom:
+                return False
+            return self._search(self.root, word, exact)
+        if self.cache is not None:
+            return self._cached(PREFIX, word, self._search_prefix)
+        return self._search_prefix(word)
+
+    def _search_prefix(self, prefix):
+        """Helper method for prefix searching"""
+        if not prefix:
             return self.root is not None and len(self) > 0
-        return self._search(self.root, word, exact)
+        return self._search(self.root, prefix, False)
+
+    def _cached(self, kind, prefix, compute):
+        """Helper method returning the cached result for (kind, prefix), computing and storing it if missing"""
+        result = self.cache.get(kind, prefix)
+        if result is None:
+            result = compute(prefix)
+            self.cache.put(kind, prefix, result)
+        return result
 
     def _search(self, node, word, exact):
         """Helper method for searching"""
@@ -112,6 +378,140 @@ class TernarySearchTree:
                     # or if there are any words extending from here
                     return True
 
+    def keys_with_prefix(self, prefix):
+        """
+        Return all strings in the tree that start with prefix, in sorted order
+        """
+        if self.cache is not None:
+            return list(self._cached(COMPLETION, prefix, self._keys_with_prefix))
+        return self._keys_with_prefix(prefix)
+
+    def _keys_with_prefix(self, prefix):
+        """Helper method for prefix enumeration"""
+        if not prefix:
+            return self.all_strings()
+        node = self._find_node(prefix)
+        if node is None:
+            return []
+
+        result = [prefix] if node.is_end_of_string else []
+        self._traverse(node.middle, list(prefix), len(prefix), result)
+        return result
+
+    def count_with_prefix(self, prefix):
+        """
+        Return the number of strings in the tree that start with prefix
+        """
+        if self.cache is not None:
+            return self._cached(COUNT, prefix, self._count_with_prefix)
+        return self._count_with_prefix(prefix)
+
+    def _count_with_prefix(self, prefix):
+        """Helper method for prefix counting"""
+        if not prefix:
+            return len(self)
+        node = self._find_node(prefix)
+        if node is None:
+            return 0
+        return int(node.is_end_of_string) + self._count_words(node.middle)
+
+    def _find_node(self, prefix):
+        """Helper method returning the node of the last character of prefix"""
+        node = self.root
+        i = 0
+        while node is not None:
+            char = prefix[i]
+            if char < node.char:
+                node = node.left
+            elif char > node.char:
+                node = node.right
+            elif i == len(prefix) - 1:
+                return node
+            else:
+                node = node.middle
+                i += 1
+        return None
+
+    def contains(self, substring):
+        """
+        Return all words containing substring, sorted and without duplicates
+
+        Needs the suffix index (suffix_index=True). Finding the node of
+        substring is proportional to its length, but then every suffix node
+        below it is visited and the k matching words are sorted, so the total
+        cost also grows with the size of that subtree plus k log k.
+        """
+        if self.suffixes is None:
+            raise ValueError("contains() needs a tree created with suffix_index=True")
+        if not substring:
+            return self.all_strings()
+        return self.suffixes.words_with_prefix(substring)
+
     def __str__(self):
         """Return string representation of the tree"""
-        return f"TST containing {len(self)} words: {self.all_strings()}"
\ No newline at end of file
+        return f"TST containing {len(self)} words: {self.all_strings()}"
+
+
+class SuffixIndex(TernarySearchTree):
+    """
+    Ternary Search Tree over every suffix of the indexed words.
+
+    The end node of each suffix references the words it is a suffix of, so
+    all words containing a substring are referenced below the node of that
+    substring.
+    """
+    node_class = SuffixTSTNode
+
+    def add(self, word):
+        """Insert every suffix of word, referencing word from each of them"""
+        for i in range(len(word)):
+            node = self._insert_node(word[i:])
+            node.is_end_of_string = True
+            if node.words is None:
+                node.words = [word]
+            else:
+                node.words.append(word)
+
+    def words_with_prefix(self, prefix):
+        """Return the sorted, deduplicated words referenced by all suffixes starting with prefix"""
+        node = self._find_node(prefix)
+        if node is None:
+            return []
+        found = dict.fromkeys(node.words or ())
+        stack = [node.middle]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            if node.words:
+                found.update(dict.fromkeys(node.words))
+            stack.append(node.left)
+            stack.append(node.middle)
+            stack.append(node.right)
+        return sorted(found)
+
+
+def _read_words(path, encoding):
+    """Yield stripped, non-blank lines of a file, reading about CHUNK_BYTES at a time"""
+    with open(path, 'r', encoding=encoding, buffering=CHUNK_BYTES) as file:
+        while True:
+            lines = file.readlines(CHUNK_BYTES)
+            if not lines:
+                return
+            for line in lines:
+                word = line.strip()
+                if word:
+                    yield word
+
+
+def _level_nodes(node):
+    """Yield the nodes of one level (linked by left/right) in character order"""
+    stack = []
+    while stack or node is not None:
+        while node is not None:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node
+        node = node.right
+
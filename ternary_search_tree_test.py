@@ -1,6 +1,15 @@
 import logging
 import os
-from ternary_search_tree import TernarySearchTree
+import tempfile
+import threading
+import pytest
+from ternary_search_tree import TernarySearchTree, BLOOM_INITIAL_CAPACITY
+from baseline_structures import SetBaseline, DictBaseline, SortedListBaseline, DictTrieBaseline
+from corpus_generator import CorpusGenerator
+from benchmark_sweep import find_regressions, summarize
+from bloom_filter import BloomFilter
+from query_cache import QueryCache
+from durable_tst import DurableTST, recover
 
 # Setup logging to both console and file
 logging.basicConfig(
@@ -139,147 +148,403 @@ def test_tst():
     logger.info("=" * 60)
 
 
-if __name__ == "__main__":
-    test_tst()import logging
-import os
-from ternary_search_tree import TernarySearchTree
-
-# Setup logging to both console and file
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s: %(message)s',
-    handlers=[
-        logging.FileHandler('tst_test_results.log'),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger(__name__)
+def test_keys_with_prefix():
+    """Test prefix enumeration on the TST"""
+    logger.info("\nTEST: Prefix Enumeration")
+    logger.info("-" * 40)
+    tst = TernarySearchTree()
+    for word in ['apple', 'app', 'apply', 'banana', 'band', 'cat']:
+        tst.insert(word)
+    
+    assert tst.keys_with_prefix('app') == ['app', 'apple', 'apply']
+    assert tst.keys_with_prefix('ban') == ['banana', 'band']
+    assert tst.keys_with_prefix('cat') == ['cat']
+    assert tst.keys_with_prefix('dog') == []
+    assert tst.keys_with_prefix('') == tst.all_strings()
+    assert TernarySearchTree().keys_with_prefix('a') == []
+    
+    # Words longer than any fixed buffer
+    long_word = 'b' + 'x' * 150
+    tst.insert(long_word)
+    tst.insert('a' * 120)
+    assert tst.keys_with_prefix('b') == ['banana', 'band', long_word]
+    assert tst.keys_with_prefix('a' * 100) == ['a' * 120]
+    assert long_word in tst.all_strings() and len(tst.all_strings()) == 8
+    logger.info("Prefix enumeration is correct")
 
 
-def create_test_files():
-    """Create test data files"""
-    os.makedirs('data/search_trees', exist_ok=True)
-    
-    insert_words = ['apple', 'app', 'banana', 'cat', 'car', 'dog', 'test', 'bomb']
-    not_insert_words = ['xyz', 'notfound', 'missing', 'fake']
-    
-    with open('data/search_trees/insert_words.txt', 'w') as f:
-        f.write('\n'.join(insert_words))
+def test_insert_many_and_from_file():
+    """Test bulk insertion from an iterable and streaming construction from a file"""
+    logger.info("\nTEST: Bulk Insertion and File Ingestion")
+    logger.info("-" * 40)
+    words = ['apple', 'app', 'banana', 'cat', 'car', 'dog', 'test', 'bomb']
     
-    with open('data/search_trees/not_insert_words.txt', 'w') as f:
-        f.write('\n'.join(not_insert_words))
+    tst = TernarySearchTree()
+    added = tst.insert_many(iter(words + ['', 'app', 'cat']))
+    assert added == len(words), f"Expected {len(words)} new words, got {added}"
+    assert tst.insert_many(['dog', 'test']) == 0, "Words already stored should not count as new"
+    assert sorted(tst.all_strings()) == sorted(words)
     
-    return insert_words, not_insert_words
+    single = TernarySearchTree()
+    for word in words:
+        single.insert(word)
+    assert tst.all_strings() == single.all_strings(), "insert_many should build the same tree as insert"
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'words.txt')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('  apple\n\napp\r\nbanana\n   \napple\ncafé\n')
+        from_file = TernarySearchTree.from_file(path, encoding='utf-8')
+    assert from_file.all_strings() == ['app', 'apple', 'banana', 'café']
+    logger.info("Bulk insertion and file ingestion are correct")
 
 
-def test_tst():
-    """Run all TST tests with detailed logging"""
-    logger.info("=" * 60)
-    logger.info("TERNARY SEARCH TREE TEST SUITE")
-    logger.info("=" * 60)
-    
-    # Create test data
-    logger.info("SETUP: Creating test data files")
-    create_test_files()
-    logger.info("Test data files created successfully")
-    
-    # Create and populate tree
-    logger.info("\nTEST 1: Tree Creation and Population")
+def test_set_operations():
+    """Test union, intersection, difference and issubset against Python sets"""
+    logger.info("\nTEST: Set Operations")
     logger.info("-" * 40)
-    tst = TernarySearchTree()
-    logger.info("Created empty TST")
+    base_words = {'apple', 'app', 'banana', 'band', 'cat', 'car', 'dog'}
+    customer_words = {'app', 'apply', 'band', 'bandana', 'cat', 'zebra'}
+    base = TernarySearchTree()
+    base.insert_many(base_words)
+    customer = TernarySearchTree()
+    customer.insert_many(customer_words)
+    empty = TernarySearchTree()
+    
+    assert base.union(customer).all_strings() == sorted(base_words | customer_words)
+    assert base.intersection(customer).all_strings() == sorted(base_words & customer_words)
+    assert base.difference(customer).all_strings() == sorted(base_words - customer_words)
+    assert customer.difference(base).all_strings() == sorted(customer_words - base_words)
+    assert base.union(empty).all_strings() == sorted(base_words)
+    assert base.intersection(empty).all_strings() == []
+    assert len(empty.union(empty)) == 0
+    
+    assert base.intersection(customer).issubset(base)
+    assert base.intersection(customer).issubset(customer)
+    assert not base.issubset(customer)
+    assert empty.issubset(base)
+    assert not base.issubset(empty)
+    
+    # 'ap' and 'ban' are only prefixes in the other tree, not words
+    prefixes = TernarySearchTree()
+    prefixes.insert_many(['ap', 'ban'])
+    assert not prefixes.issubset(base)
+    assert prefixes.intersection(base).all_strings() == []
+    
+    # Words longer than any fixed buffer, only in one tree or below a shared prefix
+    long_words = {'x' * 150, 'band' + 'a' * 120}
+    long_tree = TernarySearchTree()
+    long_tree.insert_many(long_words)
+    assert base.union(long_tree).all_strings() == sorted(base_words | long_words)
+    assert long_tree.difference(base).all_strings() == sorted(long_words)
+    assert customer.union(long_tree).intersection(long_tree).all_strings() == sorted(long_words)
+    
+    sorted_words = sorted(base_words | customer_words)
+    assert TernarySearchTree.from_sorted(sorted_words).all_strings() == sorted_words
+    logger.info("Set operations are correct")
+
+
+def test_suffix_index():
+    """Test substring queries on a suffix-indexed tree"""
+    logger.info("\nTEST: Suffix Index")
+    logger.info("-" * 40)
+    words = ['station', 'nation', 'banana', 'bandana', 'tension', 'cat', 'tiontion']
+    tst = TernarySearchTree(suffix_index=True)
+    tst.insert_many(words[:4])
+    for word in words[4:] + ['cat']:
+        tst.insert(word)
     
-    with open('data/search_trees/insert_words.txt') as f:
+    assert len(tst) == len(words)
+    for substring in ['tion', 'an', 'ana', 'at', 'ion', 'x', 'banana', 'nanab', 't']:
+        expected = sorted(w for w in words if substring in w)
+        result = tst.contains(substring)
+        logger.info(f"  contains('{substring}'): {result}")
+        assert result == expected, f"Wrong result for '{substring}': {result}"
+    assert tst.contains('') == sorted(words)
+    assert tst.search('nation', exact=True) and not tst.search('ation', exact=True)
+    
+    try:
+        TernarySearchTree().contains('a')
+        assert False, "contains() without suffix index should raise"
+    except ValueError:
+        pass
+    logger.info("Suffix index is correct")
+
+
+def test_bloom_filter():
+    """Test the Bloom filter and its use in front of exact search"""
+    logger.info("\nTEST: Bloom Filter")
+    logger.info("-" * 40)
+    with open('data/search_trees/corncob_lowercase.txt') as f:
         words = [line.strip() for line in f if line.strip()]
-    
-    logger.info(f"Reading {len(words)} words from file")
-    for word in words:
+    inserted = words[::2]
+    inserted_set = set(inserted)  # The word list contains a duplicate
+    missing = [word for word in words[1::2] if word not in inserted_set]
+    
+    bloom = BloomFilter(len(inserted), false_positive_rate=0.01)
+    for word in inserted:
+        bloom.add(word)
+    assert all(word in bloom for word in inserted), "Bloom filter must not have false negatives"
+    false_positive_rate = sum(word in bloom for word in missing) / len(missing)
+    logger.info(f"Observed false positive rate: {false_positive_rate:.4f}")
+    assert false_positive_rate < 0.02, f"False positive rate too high: {false_positive_rate}"
+    
+    # The tree starts with a small filter, which has to grow while words are inserted
+    tst = TernarySearchTree(bloom_filter=True)
+    tst.insert_many(inserted[:5000])
+    for word in inserted[5000:6000]:
         tst.insert(word)
-        logger.info(f"  Inserted: '{word}'")
-    
-    unique_words = set(words)
-    logger.info(f"Successfully inserted {len(unique_words)} unique words")
-    
-    # Test 1: Tree length
-    logger.info("\nTEST 2: Tree Length Verification")
+    assert len(tst.bloom) == 6000 and tst.bloom.capacity >= 6000
+    assert all(tst.search(word, exact=True) for word in inserted[:6000])
+    assert not any(tst.search(word, exact=True) for word in missing[:6000])
+    assert tst.search(inserted[0][:2]), "Prefix search should not use the filter"
+    assert not tst.search('', exact=True)
+    
+    # A long word that overflows the filter is still found after the rebuild
+    tst = TernarySearchTree(bloom_filter=True)
+    tst.insert_many(inserted[:BLOOM_INITIAL_CAPACITY])
+    long_word = 'x' * 150
+    tst.insert(long_word)
+    assert tst.bloom.capacity > BLOOM_INITIAL_CAPACITY and len(tst.bloom) == len(tst)
+    assert tst.search(long_word, exact=True)
+    logger.info("Bloom filter is correct")
+
+
+def test_query_cache():
+    """Test cached prefix queries, LRU eviction and insert-aware invalidation"""
+    logger.info("\nTEST: Query Cache")
     logger.info("-" * 40)
-    actual_length = len(tst)
-    expected_length = len(unique_words)
-    logger.info(f"Expected length: {expected_length}")
-    logger.info(f"Actual length: {actual_length}")
-    assert actual_length == expected_length, f"Length mismatch: expected {expected_length}, got {actual_length}"
-    logger.info("Tree length is correct")
+    cache = QueryCache(2)
+    cache.put('count', 'a', 1)
+    cache.put('count', 'b', 2)
+    assert cache.get('count', 'a') == 1
+    cache.put('count', 'c', 3)  # Evicts 'b', the least recently used entry
+    assert cache.get('count', 'b') is None and cache.evictions == 1
+    
+    tst = TernarySearchTree(cache_size=16)
+    tst.insert_many(['apple', 'app', 'banana', 'band'])
+    assert tst.keys_with_prefix('ap') == ['app', 'apple']
+    assert tst.count_with_prefix('ban') == 2
+    assert not tst.search('ca')
+    assert tst.keys_with_prefix('ap') == ['app', 'apple'] and tst.cache.hits == 1
+    
+    # Only entries for prefixes of the inserted word are dropped
+    tst.insert('cat')
+    assert tst.search('ca'), "Cached miss for a prefix of the inserted word must be invalidated"
+    assert tst.cache.invalidations == 1
+    tst.insert('apply')
+    assert tst.keys_with_prefix('ap') == ['app', 'apple', 'apply']
+    assert tst.count_with_prefix('ban') == 2 and tst.cache.invalidations == 2
+    tst.insert('app')  # Already stored, nothing changes
+    assert tst.cache.invalidations == 2
+    
+    result = tst.keys_with_prefix('ap')
+    result.append('mutated')
+    assert tst.keys_with_prefix('ap') == ['app', 'apple', 'apply'], "Cached lists must not be shared"
+    
+    plain = TernarySearchTree()
+    plain.insert_many(['apple', 'app', 'banana', 'band', 'cat', 'apply'])
+    for prefix in ['', 'a', 'ap', 'b', 'ban', 'c', 'x']:
+        assert tst.count_with_prefix(prefix) == plain.count_with_prefix(prefix) == len(plain.keys_with_prefix(prefix))
+        assert tst.search(prefix) == plain.search(prefix)
+    
+    stats = tst.cache.stats()
+    logger.info(f"Cache statistics: {stats}")
+    assert stats['size'] <= stats['maxsize'] and 0.0 < stats['hit_rate'] < 1.0
+    logger.info("Query cache is correct")
+
+
+def test_flat_tst_batch_search():
+    """Test that batch search over a flattened tree matches search exactly"""
+    pytest.importorskip('numpy')
+    from flat_tst import FlatTST
     
-    # Test 2: Exact search
-    logger.info("\nTEST 3: Exact Word Search")
+    logger.info("\nTEST: Flattened Tree Batch Search")
     logger.info("-" * 40)
-    logger.info("Testing exact search for all inserted words:")
-    for word in sorted(unique_words):
-        result = tst.search(word, exact=True)
-        logger.info(f"  Searching '{word}': {'FOUND' if result else 'NOT FOUND'}")
-        assert result, f"Word '{word}' not found with exact search"
-    logger.info("All inserted words found with exact search")
-    
-    # Test 3: Prefix search
-    logger.info("\nTEST 4: Prefix Search")
+    words = ['apple', 'app', 'banana', 'cat', 'car', 'dog', 'test', 'bomb', 'café']
+    tst = TernarySearchTree()
+    tst.insert_many(words)
+    flat = FlatTST.from_tree(tst)
+    assert len(flat) == len(tst)
+    
+    queries = words + ['', 'a', 'ap', 'appl', 'apples', 'b', 'ca', 'caf', 'cab', 'xyz', 'dogs', 'é']
+    for exact in (True, False):
+        result = flat.search_many(queries, exact=exact).tolist()
+        expected = [tst.search(query, exact=exact) for query in queries]
+        assert result == expected, f"Batch search differs from search (exact={exact})"
+    
+    # Trailing NUL characters must not be dropped by the encoding
+    tst.insert('ab')
+    tst.insert('x\x00')
+    flat = FlatTST.from_tree(tst)
+    queries = ['a\x00', 'ab\x00', 'x', 'x\x00', 'x\x00\x00', '\x00']
+    for exact in (True, False):
+        assert flat.search_many(queries, exact=exact).tolist() == [tst.search(query, exact=exact) for query in queries]
+    
+    empty = FlatTST.from_tree(TernarySearchTree())
+    assert empty.search_many(['a', ''], exact=False).tolist() == [False, False]
+    assert flat.search_many([]).tolist() == []
+    logger.info("Batch search matches search")
+
+
+def test_durable_tst():
+    """Test journaling, background compaction and recovery of a DurableTST"""
+    logger.info("\nTEST: Durable Tree")
     logger.info("-" * 40)
-    test_prefixes = ['ap', 'ca', 'te', 'bo']
-    logger.info("Testing prefix search:")
-    for prefix in test_prefixes:
-        result = tst.search(prefix, exact=False)
-        logger.info(f"  Prefix '{prefix}': {'FOUND' if result else 'NOT FOUND'}")
-        assert result, f"Prefix '{prefix}' not found"
-    logger.info("All tested prefixes found")
-    
-    # Test 4: Words not in tree
-    logger.info("\nTEST 5: Negative Search (Words Not in Tree)")
+    with open('data/search_trees/corncob_lowercase.txt') as f:
+        words = [line.strip() for line in f if line.strip()][:3000]
+    
+    with tempfile.TemporaryDirectory() as directory:
+        tst = DurableTST(directory, batch_size=50, compact_every=1000)
+        tst.insert_many(words[:2500])
+        for word in words[2500:]:
+            tst.insert(word)
+        tst.insert(words[0])  # Already stored, not journaled again
+        
+        # Recovery without close, as after a crash, sees everything that was flushed
+        tst.flush()
+        tst.wait_for_compaction()
+        recovered, _ = recover(directory)
+        assert recovered.all_strings() == sorted(set(words))
+        tst.close()
+        
+        files = sorted(os.listdir(directory))
+        logger.info(f"Files after compaction: {files}")
+        assert sum(name.startswith('checkpoint') for name in files) == 1
+        
+        with DurableTST(directory) as reopened:
+            assert reopened.all_strings() == sorted(set(words))
+            reopened.insert('zzzz')
+            reopened.checkpoint()
+        
+        # A torn last line in the journal is ignored
+        with DurableTST(directory, fsync='never') as reopened:
+            reopened.insert('torn')
+            journal_path = reopened._journal.name
+        with open(journal_path, 'a', encoding='utf-8') as f:
+            f.write('partial')
+        recovered, _ = recover(directory)
+        assert recovered.search('zzzz', exact=True) and recovered.search('torn', exact=True)
+        assert not recovered.search('partial', exact=True)
+        assert len(recovered) == len(set(words)) + 2
+        
+        # Words that cannot be stored as one UTF-8 journal line are rejected before they reach the tree
+        with DurableTST(directory) as rejecting:
+            with pytest.raises(ValueError):
+                rejecting.insert('two\nwords')
+            with pytest.raises(UnicodeEncodeError):
+                rejecting.insert('bad\ud800')
+            assert len(rejecting) == len(set(words)) + 2
+    
+    # A failed compaction is reported even when a later one succeeds
+    with tempfile.TemporaryDirectory() as directory:
+        failing = DurableTST(directory, batch_size=1, compact_every=1)
+        compact = failing._compact
+        release = threading.Event()
+        outcomes = iter([OSError("disk full"), None])
+        
+        def compact_once(seq):
+            release.wait()  # Keeps the first compaction running until the second is submitted
+            error = next(outcomes)
+            if error:
+                raise error
+            compact(seq)
+        
+        failing._compact = compact_once
+        failing.insert('first')
+        failing.insert('second')
+        release.set()
+        with pytest.raises(OSError):
+            failing.wait_for_compaction()
+        failing.close()
+    logger.info("Durable tree is correct")
+
+
+def test_baseline_structures():
+    """Test that all baseline structures agree with the TST on the same workload"""
+    logger.info("\nTEST: Baseline Structures")
     logger.info("-" * 40)
-    logger.info("Testing that non-inserted words are not found:")
-    with open('data/search_trees/not_insert_words.txt') as f:
-        for line in f:
-            word = line.strip()
-            if word:
-                result = tst.search(word, exact=True)
-                logger.info(f"  Searching '{word}': {'FOUND' if result else 'NOT FOUND'}")
-                assert not result, f"Word '{word}' should not be found"
-    logger.info("Non-inserted words correctly not found")
+    words = ['apple', 'app', 'banana', 'cat', 'car', 'dog', 'test', 'bomb', 'app']
+    tst = TernarySearchTree()
+    for word in words:
+        tst.insert(word)
     
-    # Test 5: All strings retrieval
-    logger.info("\nTEST 6: All Strings Retrieval")
+    for factory in (SetBaseline, DictBaseline, SortedListBaseline, DictTrieBaseline):
+        structure = factory()
+        for word in words:
+            structure.insert(word)
+        logger.info(f"  Checking {factory.__name__}")
+        assert len(structure) == len(tst)
+        for query in ['app', 'apple', 'ap', 'ca', 'xyz', 'bombs', '']:
+            assert structure.search(query, exact=True) == tst.search(query, exact=True), query
+            assert structure.search(query, exact=False) == tst.search(query, exact=False), query
+        for prefix in ['a', 'ca', 'b', 'z', '']:
+            assert structure.keys_with_prefix(prefix) == tst.keys_with_prefix(prefix), prefix
+    logger.info("All baseline structures agree with the TST")
+
+
+def test_corpus_generator():
+    """Test reproducibility, lengths, uniqueness and ordering of the synthetic corpus"""
+    logger.info("\nTEST: Synthetic Corpus Generator")
     logger.info("-" * 40)
-    all_strings = tst.all_strings()
-    logger.info(f"Retrieved {len(all_strings)} strings from tree")
-    logger.info(f"Retrieved strings: {sorted(all_strings)}")
-    logger.info(f"Expected strings: {sorted(unique_words)}")
-    assert len(all_strings) == len(unique_words), f"Wrong count: got {len(all_strings)}, expected {len(unique_words)}"
-    assert set(all_strings) == unique_words, "Retrieved strings don't match inserted words"
-    logger.info("All strings retrieval is correct")
+    words = list(CorpusGenerator(seed=7).words(2000))
+    assert words == list(CorpusGenerator(seed=7).words(2000)), "Same seed should give the same corpus"
+    assert words != list(CorpusGenerator(seed=8).words(2000)), "Different seeds should give different corpora"
+    assert len(set(words)) == len(words), "Words should be unique"
+    assert all(3 <= len(w) <= 14 for w in words), "Words should respect the length bounds"
+    
+    fixed = list(CorpusGenerator(seed=7, length_distribution='fixed', mean_length=6).words(500))
+    assert all(len(w) == 6 for w in fixed), "Fixed length distribution should give equal lengths"
+    
+    sorted_words = list(CorpusGenerator(seed=7).words(2000, order='sorted'))
+    assert sorted_words == sorted(words)
+    assert list(CorpusGenerator(seed=7).words(2000, order='reverse')) == sorted_words[::-1]
+    
+    # Shared prefixes should make many more words share their first three letters
+    def shared(corpus):
+        return len(corpus) - len({w[:3] for w in corpus})
+    no_prefix = list(CorpusGenerator(seed=7, shared_prefix_ratio=0.0).words(2000))
+    all_prefix = list(CorpusGenerator(seed=7, shared_prefix_ratio=1.0).words(2000))
+    assert shared(all_prefix) > shared(no_prefix)
     
-    # Test 6: Edge cases
-    logger.info("\nTEST 7: Edge Cases")
+    tst = TernarySearchTree()
+    for word in words:
+        tst.insert(word)
+    assert len(tst) == len(words)
+    logger.info("Synthetic corpus generator is correct")
+
+
+def test_sweep_regression_gate():
+    """Test the median summary and baseline comparison of the benchmark sweep"""
+    logger.info("\nTEST: Sweep Regression Gate")
     logger.info("-" * 40)
-    
-    # Empty string prefix search
-    empty_prefix_result = tst.search('', exact=False)
-    logger.info(f"Empty string prefix search: {'FOUND' if empty_prefix_result else 'NOT FOUND'}")
-    assert empty_prefix_result, "Empty string should be found in prefix search"
-    
-    # Empty string exact search
-    empty_exact_result = tst.search('', exact=True)
-    logger.info(f"Empty string exact search: {'FOUND' if empty_exact_result else 'NOT FOUND'}")
-    assert not empty_exact_result, "Empty string should not be found in exact search"
-    
-    logger.info("Edge cases handled correctly")
-    
-    # Final summary
-    logger.info("\n" + "=" * 60)
-    logger.info("TEST RESULTS SUMMARY")
-    logger.info("=" * 60)
-    logger.info("ALL TESTS PASSED SUCCESSFULLY!")
-    logger.info(f"Tree contains {len(tst)} words: {sorted(tst.all_strings())}")
-    logger.info(f"Test results saved to: tst_test_results.log")
-    logger.info("=" * 60)
+    runs = [{'size': 100, 'source': 'word_file', 'insert_rate': rate, 'search_rate': 1000.0, 'miss_rate': 2000.0}
+            for rate in (80.0, 100.0, 120.0)]
+    runs.append({'size': 100, 'source': 'synthetic', 'insert_rate': 1.0, 'search_rate': 1.0, 'miss_rate': 1.0})
+    summary = summarize(runs)
+    assert summary == {'word_file': {'100': {'insert_rate': 100.0, 'search_rate': 1000.0, 'miss_rate': 2000.0}},
+                       'synthetic': {'100': {'insert_rate': 1.0, 'search_rate': 1.0, 'miss_rate': 1.0}}}
+    
+    # The synthetic runs have no baseline of their own, they are not compared with the word file ones
+    baseline = {'word_file': {'100': {'insert_rate': 105.0, 'search_rate': 1300.0, 'miss_rate': 2000.0},
+                              '500': {'insert_rate': 1.0, 'search_rate': 1.0, 'miss_rate': 1.0}}}
+    regressions = find_regressions(summary, baseline, tolerance=0.1)
+    logger.info(f"Regressions: {regressions}")
+    assert len(regressions) == 1 and 'word_file' in regressions[0] and 'search_rate' in regressions[0]
+    assert find_regressions(summary, baseline, tolerance=0.5) == []
+    logger.info("Sweep regression gate is correct")
 
 
 if __name__ == "__main__":
-    test_tst()
\ No newline at end of file
+    test_tst()
+    test_keys_with_prefix()
+    test_insert_many_and_from_file()
+    test_set_operations()
+    test_suffix_index()
+    test_bloom_filter()
+    test_query_cache()
+    test_flat_tst_batch_search()
+    test_durable_tst()
+    test_baseline_structures()
+    test_corpus_generator()
+    test_sweep_regression_gate()